@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: list of formatted strings vs. the compact Transcript.
+
+Simulates a long meeting without calling OpenAI and reports the memory held
+per turn by each representation.
+"""
+
+import argparse
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from transcript import Transcript
+
+SPEAKERS = [
+    ("ceo", "Chief Executive Officer (CEO)"),
+    ("cfo", "Chief Financial Officer (CFO)"),
+    ("cto", "Chief Technology Officer (CTO)"),
+    ("coo", "Chief Operating Officer (COO)"),
+    ("marketing", "Vice President of Marketing"),
+]
+PHASES = ["opening", "topic_opening", "response", "debate", "round_table", "closing"]
+WORDS = (
+    "we need to balance investment in AI capabilities with margin discipline "
+    "and our customers expect faster delivery across emerging markets while "
+    "operations must scale the team without compromising quality or ROI"
+).split()
+
+
+def make_turns(count: int, seed: int = 7) -> list[tuple[str, str, str, str]]:
+    """Generate (agent, role, phase, content) tuples of typical turn length."""
+    rng = random.Random(seed)
+    turns = []
+    for _ in range(count):
+        agent, role = rng.choice(SPEAKERS)
+        content = " ".join(rng.choice(WORDS) for _ in range(rng.randint(40, 90)))
+        turns.append((agent, role, rng.choice(PHASES), content + "."))
+    return turns
+
+
+def measure(build) -> int:
+    """Bytes still allocated by the object ``build`` returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--turns", type=int, default=50_000)
+    args = parser.parse_args()
+
+    turns = make_turns(args.turns)
+
+    def build_list():
+        # Previous representation: one formatted string per turn
+        return [f"[{role}]\n{content}\n" for _, role, _, content in turns]
+
+    def build_transcript():
+        transcript = Transcript()
+        for agent, role, phase, content in turns:
+            transcript.append(agent, role, content, phase, 1.25, 180)
+        return transcript
+
+    list_bytes = measure(build_list)
+    transcript_bytes = measure(build_transcript)
+
+    print(f"Turns: {args.turns:,}")
+    print(f"  list[str]   {list_bytes / args.turns:8.1f} bytes/turn")
+    print(
+        f"  Transcript  {transcript_bytes / args.turns:8.1f} bytes/turn "
+        "(including latency and token columns)"
+    )
+    print(f"  Saved       {1 - transcript_bytes / list_bytes:8.1%}")
+
+    transcript = build_transcript()
+    assert transcript.to_text() == "\n".join(build_list())
+
+
+if __name__ == "__main__":
+    main()
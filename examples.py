@@ -19,6 +19,8 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from dotenv import load_dotenv
 from colorama import Fore, Style
 from team_meeting import TeamMeeting
+from agenda import DEFAULT_AGENDA, Discussion
+from branching import BranchingMeeting, branch_report, what_if
 
 load_dotenv()
 
@@ -200,6 +202,39 @@ def scenario_6_one_on_one_debate():
     meeting.save_transcript("growth_vs_profitability_debate.txt")
 
 
+def scenario_7_what_if_branches():
+    """Scenario 7: One shared meeting start, three alternative endings."""
+    print(
+        f"\n{Fore.CYAN}SCENARIO 7: What-If Branches - Shared Start, Alternative Endings{Style.RESET_ALL}\n"
+    )
+    # The first three agenda items are generated once and shared by every variant
+    tree = what_if(
+        DEFAULT_AGENDA,
+        fork_after=3,
+        variants={
+            "baseline": {},
+            "risk_averse_cfo": {
+                "personas": {
+                    "cfo": {"personality": "Deeply risk-averse and focused on cash preservation."}
+                }
+            },
+            "acquisition_pivot": {
+                "items": [
+                    Discussion(
+                        "Should we acquire a smaller AI competitor instead of building in-house?",
+                        primary_speaker="ceo",
+                    )
+                ]
+            },
+        },
+    )
+    runner = BranchingMeeting(lambda: TeamMeeting(verbose=False), DEFAULT_AGENDA.title)
+    root = runner.run(tree)
+    print(branch_report(root))
+    runner.save(root, "what_if_meeting")
+    print(f"\n{Fore.GREEN}Transcripts saved to what_if_meeting/{Style.RESET_ALL}")
+
+
 def list_scenarios():
     """List all available scenarios."""
     scenarios = {
@@ -209,6 +244,7 @@ def list_scenarios():
         "4": ("Cost Optimization", scenario_4_cost_optimization),
         "5": ("Crisis Response", scenario_5_crisis_response),
         "6": ("Growth vs. Profitability Debate", scenario_6_one_on_one_debate),
+        "7": ("What-If Branches", scenario_7_what_if_branches),
     }
     return scenarios
 
@@ -221,7 +257,7 @@ def main():
     parser.add_argument(
         "scenario",
         nargs="?",
-        help="Scenario number (1-6). If not provided, you'll be prompted.",
+        help="Scenario number (1-7). If not provided, you'll be prompted.",
     )
     parser.add_argument(
         "--audio",
@@ -263,7 +299,7 @@ def main():
     if args.scenario:
         choice = args.scenario
     else:
-        choice = input(f"{Fore.YELLOW}Select scenario (1-6): {Style.RESET_ALL}").strip()
+        choice = input(f"{Fore.YELLOW}Select scenario (1-7): {Style.RESET_ALL}").strip()
 
     if choice in scenarios:
         name, func = scenarios[choice]
@@ -271,7 +307,7 @@ def main():
         func()
         print(f"\n{Fore.GREEN}Meeting completed!{Style.RESET_ALL}")
     else:
-        print(f"{Fore.RED}Invalid scenario. Please select 1-6.{Style.RESET_ALL}")
+        print(f"{Fore.RED}Invalid scenario. Please select 1-7.{Style.RESET_ALL}")
         sys.exit(1)
 
 
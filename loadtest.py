@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Load test: how many concurrent meetings can one worker sustain?
+
+Starts the local OpenAI-compatible mock server in a separate process, points
+ChatOpenAI at it, and runs batches of concurrent TeamMeetings at increasing
+concurrency levels. For each level it reports throughput, turn latency
+percentiles, error rates, and CPU and memory per meeting, so the scaling knee
+can be found without spending API credits.
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from agenda import DEFAULT_AGENDA
+from mock_server import MockConfig, MockOpenAIServer
+from routing import percentile
+from scheduler import BATCH, INTERACTIVE, LLMScheduler
+from team_meeting import TeamMeeting
+
+
+def _serve(config: MockConfig, port_queue):
+    server = MockOpenAIServer(config)
+    port_queue.put(server.server_address[1])
+    server.serve_forever()
+
+
+def start_mock_server(config: MockConfig) -> tuple[multiprocessing.Process, str]:
+    """Run the mock server in a child process and return it with its base URL."""
+    port_queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(config, port_queue), daemon=True)
+    process.start()
+    port = port_queue.get(timeout=10)
+    return process, f"http://127.0.0.1:{port}/v1"
+
+
+def server_counts(base_url: str) -> Counter:
+    """Fetch the mock server's request outcome counters."""
+    with urllib.request.urlopen(base_url.removesuffix("/v1") + "/stats") as response:
+        return Counter(json.load(response))
+
+
+def current_rss_mb() -> float:
+    """Current resident set size of this process in MB (0 without /proc)."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return 0.0
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+class RSSSampler:
+    """Samples current RSS in the background and tracks growth over a baseline.
+
+    Unlike the process-lifetime peak, the baseline is taken when the
+    sampler starts, so each concurrency level is measured on its own.
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.baseline = 0.0
+        self.peak = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> "RSSSampler":
+        gc.collect()
+        self.baseline = self.peak = current_rss_mb()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss_mb())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss_mb())
+
+    @property
+    def growth_mb(self) -> float:
+        return max(0.0, self.peak - self.baseline)
+
+
+def run_meeting(agenda, scheduler=None, priority=INTERACTIVE):
+    """Run one quiet meeting; return its turn latencies and any error."""
+    meeting = TeamMeeting(verbose=False, scheduler=scheduler, priority=priority)
+    try:
+        meeting.run_agenda(agenda)
+        error = None
+    except Exception as e:
+        error = type(e).__name__
+    return list(meeting.meeting_transcript.latency), error
+
+
+def run_level(
+    concurrency: int,
+    meetings: int,
+    base_url: str,
+    agenda=DEFAULT_AGENDA,
+    scheduler=None,
+    batch_share: float = 0.0,
+) -> dict:
+    """Run ``meetings`` meetings with ``concurrency`` in flight at once.
+
+    With a scheduler, every meeting's calls go through it and the first
+    ``batch_share`` of the meetings run at batch priority.
+    """
+    batch_meetings = int(meetings * batch_share)
+    priorities = [BATCH] * batch_meetings + [INTERACTIVE] * (meetings - batch_meetings)
+    counts_before = server_counts(base_url)
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+
+    with RSSSampler() as rss, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(
+            pool.map(lambda priority: run_meeting(agenda, scheduler, priority), priorities)
+        )
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    counts = server_counts(base_url) - counts_before
+
+    latencies = [latency for turn_latencies, _ in results for latency in turn_latencies]
+    errors = Counter(error for _, error in results if error)
+    completed = meetings - sum(errors.values())
+    requests = max(counts["requests"], 1)
+    return {
+        "concurrency": concurrency,
+        "meetings": meetings,
+        "completed": completed,
+        "meetings_per_s": completed / wall,
+        "turns_per_s": len(latencies) / wall,
+        "p50": percentile(latencies, 0.50) or 0.0,
+        "p95": percentile(latencies, 0.95) or 0.0,
+        "p99": percentile(latencies, 0.99) or 0.0,
+        "failed_meetings": dict(errors),
+        "http_429_rate": counts["rate_limited"] / requests,
+        "http_5xx_rate": counts["errors"] / requests,
+        "cpu_ms_per_meeting": 1000 * cpu / meetings,
+        "rss_mb_per_meeting": rss.growth_mb / concurrency,
+    }
+
+
+def print_report(rows: list[dict]):
+    """Print one line per concurrency level and the best throughput level."""
+    print(
+        f"{'conc':>5} {'done':>6} {'mtg/s':>7} {'turn/s':>7} {'p50 s':>6} {'p95 s':>6} "
+        f"{'p99 s':>6} {'429%':>6} {'5xx%':>6} {'cpu ms':>7} {'MB/mtg':>7}  failures"
+    )
+    for row in rows:
+        print(
+            f"{row['concurrency']:>5} {row['completed']:>6} {row['meetings_per_s']:>7.2f} "
+            f"{row['turns_per_s']:>7.1f} {row['p50']:>6.2f} {row['p95']:>6.2f} "
+            f"{row['p99']:>6.2f} {row['http_429_rate']:>6.1%} {row['http_5xx_rate']:>6.1%} "
+            f"{row['cpu_ms_per_meeting']:>7.1f} {row['rss_mb_per_meeting']:>7.2f}  "
+            f"{row['failed_meetings'] or '-'}"
+        )
+    best = max(rows, key=lambda row: row["meetings_per_s"])
+    print(
+        f"\nPeak throughput {best['meetings_per_s']:.2f} meetings/s "
+        f"at concurrency {best['concurrency']}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test TeamMeeting against a mock OpenAI server.")
+    parser.add_argument(
+        "--concurrency",
+        default="1,4,16,32",
+        help="Comma-separated numbers of concurrent meetings to test",
+    )
+    parser.add_argument(
+        "--meetings-per-slot",
+        type=int,
+        default=2,
+        help="Meetings run per concurrent slot at each level",
+    )
+    parser.add_argument("--latency", type=float, default=0.5, help="Median mock latency (s)")
+    parser.add_argument("--jitter", type=float, default=0.3, help="Log-normal latency sigma")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of HTTP 500s")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction of HTTP 429s")
+    parser.add_argument(
+        "--slots",
+        type=int,
+        help="Put an LLMScheduler with this many concurrent calls in front of every meeting",
+    )
+    parser.add_argument(
+        "--batch-share",
+        type=float,
+        default=0.0,
+        help="With --slots, fraction of meetings run at batch priority",
+    )
+    parser.add_argument("--json", help="Also write the results to this JSON file")
+    args = parser.parse_args()
+
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.rate_limit_rate)
+    process, base_url = start_mock_server(config)
+    # ChatOpenAI reads these when agents are created
+    os.environ["OPENAI_BASE_URL"] = base_url
+    os.environ["OPENAI_API_BASE"] = base_url
+    os.environ["OPENAI_API_KEY"] = "mock-key"
+    print(f"Mock OpenAI server at {base_url}\n")
+
+    rows = []
+    try:
+        # Pay import, client and connection warm-up before any level is measured
+        run_meeting(DEFAULT_AGENDA)
+        for level in (int(c) for c in args.concurrency.split(",")):
+            scheduler = LLMScheduler(max_concurrency=args.slots) if args.slots else None
+            rows.append(
+                run_level(
+                    level,
+                    level * args.meetings_per_slot,
+                    base_url,
+                    scheduler=scheduler,
+                    batch_share=args.batch_share,
+                )
+            )
+            if scheduler:
+                print(f"Scheduler at concurrency {level}:\n{scheduler.report()}\n")
+    finally:
+        process.terminate()
+
+    print_report(rows)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
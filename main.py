@@ -19,6 +19,15 @@ load_dotenv()
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
 from team_meeting import TeamMeeting
+from routing import RoutingPolicy
+from hedging import HedgePolicy
+from summary import MeetingSummarizer
+from tracing import Tracer
+from scenario import cache_stats, load_scenario
+from convergence import ConvergenceDetector, debate_report
+from agenda import DEFAULT_AGENDA
+from panel import PanelResponder
+from metrics import MeetingMetrics
 from colorama import Fore, Style
 
 
@@ -49,6 +58,70 @@ def main():
         action="store_true",
         help="Enable text-to-speech output with agent-specific voices",
     )
+    parser.add_argument(
+        "--tiered-models",
+        action="store_true",
+        help="Route turns across fast/standard/strong models and report per-route latency and cost",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Hedge LLM calls that run past the per-model p95 latency",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="Keep a running meeting summary and use it for the closing remarks",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write phase, LLM and TTS spans as a Chrome/Perfetto trace JSON file",
+    )
+    parser.add_argument(
+        "--trace-otlp",
+        metavar="FILE",
+        help="Append spans to FILE in OTLP/JSON format",
+    )
+    parser.add_argument(
+        "--stream-audio",
+        action="store_true",
+        help="With --audio, start speaking each response sentence by sentence while it generates",
+    )
+    parser.add_argument(
+        "--scenario",
+        metavar="FILE",
+        help="Run the team and agenda defined in a TOML or JSON scenario file",
+    )
+    parser.add_argument(
+        "--debate-turns",
+        type=int,
+        metavar="N",
+        help="Let debates run up to N statements, stopping early once positions converge",
+    )
+    parser.add_argument(
+        "--panel-responses",
+        action="store_true",
+        help="Generate all of a topic's colleague responses in one structured call",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        metavar="FILE",
+        help="Write Prometheus-format metrics to FILE after the meeting",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        metavar="PORT",
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics during the meeting",
+    )
+    parser.add_argument(
+        "--relevance-threshold",
+        type=float,
+        default=0.0,
+        metavar="SCORE",
+        help="Skip discussion responses from colleagues whose expertise scores below SCORE for the topic",
+    )
     args = parser.parse_args()
 
     print(f"{Fore.CYAN}{'=' * 80}{Style.RESET_ALL}")
@@ -70,8 +143,71 @@ def main():
         )
 
     try:
-        meeting = TeamMeeting(enable_audio=args.audio)
-        meeting.run_full_meeting()
+        routing_policy = RoutingPolicy.default() if args.tiered_models else None
+        hedge_policy = HedgePolicy() if args.hedge else None
+        tracer = Tracer() if args.trace or args.trace_otlp else None
+        metrics = None
+        if args.metrics_file or args.metrics_port:
+            metrics = MeetingMetrics()
+            metrics.watch_scenario_cache(cache_stats)
+            if args.metrics_port:
+                metrics.registry.serve(args.metrics_port)
+        options = dict(
+            enable_audio=args.audio,
+            routing_policy=routing_policy,
+            hedge_policy=hedge_policy,
+            summarizer=MeetingSummarizer() if args.summary else None,
+            tracer=tracer,
+            stream_audio=args.stream_audio,
+            convergence=ConvergenceDetector() if args.debate_turns else None,
+            panel_responder=PanelResponder() if args.panel_responses else None,
+            metrics=metrics,
+            relevance_threshold=args.relevance_threshold,
+        )
+        if args.scenario:
+            scenario = load_scenario(args.scenario)
+            meeting = TeamMeeting.from_scenario(scenario, **options)
+            agenda = scenario.agenda
+        else:
+            meeting = TeamMeeting(**options)
+            agenda = DEFAULT_AGENDA
+        if args.debate_turns:
+            agenda = agenda.with_debate_turns(args.debate_turns)
+        try:
+            meeting.run_agenda(agenda)
+            meeting.save_transcript()
+        finally:
+            # Export even after a failure: that is the trace most worth reading
+            if args.trace:
+                tracer.export_chrome(args.trace)
+                print(f"{Fore.GREEN}Trace written to {args.trace}{Style.RESET_ALL}")
+            if args.trace_otlp:
+                tracer.export_otlp(args.trace_otlp)
+            if args.metrics_file:
+                metrics.registry.write(args.metrics_file)
+        latencies = meeting.voice_engine.first_audio_latencies
+        if latencies:
+            print(
+                f"{Fore.CYAN}Mean time to first audio per turn: "
+                f"{sum(latencies) / len(latencies):.2f}s{Style.RESET_ALL}"
+            )
+        if routing_policy:
+            print(f"\n{Fore.CYAN}Model routing statistics:{Style.RESET_ALL}")
+            print(routing_policy.report())
+        if hedge_policy:
+            print(f"\n{Fore.CYAN}Request hedging:{Style.RESET_ALL}")
+            print(hedge_policy.report())
+        if meeting.skipped_responses:
+            print(
+                f"{Fore.CYAN}Skipped {meeting.skipped_responses} low-relevance "
+                f"discussion responses{Style.RESET_ALL}"
+            )
+        if meeting.panel_responder:
+            print(f"\n{Fore.CYAN}Panel responses:{Style.RESET_ALL}")
+            print(meeting.panel_responder.report())
+        if meeting.debate_outcomes and args.debate_turns:
+            print(f"\n{Fore.CYAN}Debates:{Style.RESET_ALL}")
+            print(debate_report(meeting.debate_outcomes))
         print(f"\n{Fore.GREEN}Meeting completed successfully!{Style.RESET_ALL}")
     except Exception as e:
         print(f"\n{Fore.RED}Error during meeting: {str(e)}{Style.RESET_ALL}")
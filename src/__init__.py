@@ -2,6 +2,20 @@
 
 from .agents import CorporateAgent, CEO, CFO, CTO, COO, VPMarketing
 from .team_meeting import TeamMeeting
+from .transcript import Transcript, Utterance
+from .agenda import Agenda, Debate, Discussion, RoundTable
+from .branching import Branch, BranchingMeeting, what_if
+from .convergence import ConvergenceDetector, DebateOutcome
+from .panel import PanelResponder
+from .relevance import RelevanceIndex
+from .batch import BatchMeetingRunner, LocalBatchEndpoint
+from .scenario import CompiledScenario, load_scenario
+from .routing import ModelTier, RouteRule, RoutingPolicy
+from .hedging import HedgePolicy
+from .scheduler import LLMScheduler
+from .metrics import MeetingMetrics, MetricsRegistry
+from .summary import MeetingSummarizer
+from .tracing import Tracer
 from .tts import AgentVoice, create_voice_engine
 
 __version__ = "0.1.0"
@@ -14,6 +28,32 @@ __all__ = [
     "COO",
     "VPMarketing",
     "TeamMeeting",
+    "Transcript",
+    "Utterance",
+    "Agenda",
+    "Discussion",
+    "Debate",
+    "RoundTable",
+    "Branch",
+    "BranchingMeeting",
+    "what_if",
+    "ConvergenceDetector",
+    "DebateOutcome",
+    "PanelResponder",
+    "RelevanceIndex",
+    "BatchMeetingRunner",
+    "LocalBatchEndpoint",
+    "CompiledScenario",
+    "load_scenario",
+    "ModelTier",
+    "RouteRule",
+    "RoutingPolicy",
+    "HedgePolicy",
+    "LLMScheduler",
+    "MeetingMetrics",
+    "MetricsRegistry",
+    "MeetingSummarizer",
+    "Tracer",
     "AgentVoice",
     "create_voice_engine",
 ]
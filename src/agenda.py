@@ -0,0 +1,107 @@
+"""Meeting agenda definitions shared by live and batch meeting runners."""
+
+from dataclasses import asdict, dataclass, field, replace
+from typing import Union
+
+
+@dataclass(frozen=True)
+class Discussion:
+    """A topic opened by one speaker followed by colleague responses."""
+
+    topic: str
+    primary_speaker: str = "ceo"
+    num_responses: int = 3
+    kind: str = field(default="discussion", init=False)
+
+
+@dataclass(frozen=True)
+class Debate:
+    """A structured debate between two executives.
+
+    ``max_turns`` counts statements: the default three are side1's opening,
+    side2's response and side1's rebuttal. Longer debates keep alternating
+    and may stop early when the meeting has a convergence detector.
+    """
+
+    topic: str
+    side1: str
+    side2: str
+    max_turns: int = 3
+    kind: str = field(default="debate", init=False)
+
+
+@dataclass(frozen=True)
+class RoundTable:
+    """A round in which every agent contributes on a topic."""
+
+    topic: str
+    kind: str = field(default="round_table", init=False)
+
+
+AgendaItem = Union[Discussion, Debate, RoundTable]
+
+_ITEM_TYPES = {"discussion": Discussion, "debate": Debate, "round_table": RoundTable}
+
+
+@dataclass(frozen=True)
+class Agenda:
+    """An ordered list of agenda items between opening and closing remarks."""
+
+    title: str
+    items: tuple[AgendaItem, ...]
+
+    def to_dict(self) -> dict:
+        """Convert the agenda to plain JSON-serializable data."""
+        return {"title": self.title, "items": [asdict(item) for item in self.items]}
+
+    def with_debate_turns(self, max_turns: int) -> "Agenda":
+        """Return a copy of the agenda whose debates run up to max_turns statements."""
+        items = tuple(
+            replace(item, max_turns=max_turns) if item.kind == "debate" else item
+            for item in self.items
+        )
+        return replace(self, items=items)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Agenda":
+        """Build an agenda from the output of ``to_dict``."""
+        items = []
+        for raw in data["items"]:
+            raw = dict(raw)
+            kind = raw.pop("kind")
+            if kind not in _ITEM_TYPES:
+                raise ValueError(f"Unknown agenda item kind: {kind}")
+            items.append(_ITEM_TYPES[kind](**raw))
+        return cls(title=data["title"], items=tuple(items))
+
+
+DEFAULT_AGENDA = Agenda(
+    title="TECHVENTURE CORP - QUARTERLY STRATEGY MEETING",
+    items=(
+        # AI Innovation Strategy
+        Discussion(
+            "Should we invest heavily in in-house AI/ML capabilities or partner with external AI providers?",
+            primary_speaker="cto",
+        ),
+        # Budget vs Innovation debate
+        Debate(
+            "Budget Allocation: R&D Investment vs Shareholder Returns",
+            side1="cto",
+            side2="cfo",
+        ),
+        # Market Expansion
+        RoundTable(
+            "How should we position TechVenture in emerging markets while managing operational complexity?"
+        ),
+        # Team Integration Topic
+        Discussion(
+            "What are the key talent challenges in scaling our AI team?",
+            primary_speaker="coo",
+        ),
+        # Final Strategy
+        Discussion(
+            "What should be our primary competitive advantage in the next 18 months?",
+            primary_speaker="marketing",
+        ),
+    ),
+)
@@ -1,9 +1,38 @@
 """Base corporate agent class and specialized agent roles."""
 
-from typing import Optional
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, NamedTuple, Optional
 from pydantic import BaseModel, ConfigDict
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage, BaseMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, BaseMessage
+
+from routing import estimate_tokens
+
+
+def render_system_prompt(
+    name: str, role: str, expertise: list[str], personality: str, company: str
+) -> str:
+    """Render an agent's system prompt from its persona."""
+    return f"""You are {name}, the {role} at {company}.
+
+Your expertise: {", ".join(expertise)}
+Your personality: {personality}
+
+You are participating in a corporate strategy meeting. Provide thoughtful, data-driven insights from your perspective. 
+Be respectful of other team members' viewpoints while advocating for your department's priorities.
+Keep responses concise (2-3 sentences) unless asked for more detail.
+Use real business terminology and concepts relevant to your role."""
+
+
+class CallRecord(NamedTuple):
+    """Timing and token usage of an agent's most recent LLM call."""
+
+    phase: str
+    model: str
+    latency: float
+    input_tokens: int
+    output_tokens: int
 
 
 class CorporateAgent(BaseModel):
@@ -15,6 +44,17 @@ class CorporateAgent(BaseModel):
     personality: str
     llm: Optional[ChatOpenAI] = None
     conversation_history: list[BaseMessage] = []
+    key: Optional[str] = None
+    router: Optional[Any] = None
+    hedger: Optional[Any] = None
+    tracer: Optional[Any] = None
+    scheduler: Optional[Any] = None
+    metrics: Optional[Any] = None
+    meeting_id: Optional[str] = None
+    priority: str = "interactive"
+    last_call: Optional[CallRecord] = None
+    company: str = "TechVenture Corp"
+    system_prompt: Optional[str] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -24,46 +64,29 @@ class CorporateAgent(BaseModel):
         super().__init__(
             name=name, role=role, expertise=expertise, personality=personality, **kwargs
         )
-        self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+        if self.llm is None:
+            self.llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
         self.conversation_history = []
 
     def get_system_prompt(self) -> str:
         """Get the system prompt for this agent."""
-        return f"""You are {self.name}, the {self.role} at TechVenture Corp.
-
-Your expertise: {", ".join(self.expertise)}
-Your personality: {self.personality}
-
-You are participating in a corporate strategy meeting. Provide thoughtful, data-driven insights from your perspective. 
-Be respectful of other team members' viewpoints while advocating for your department's priorities.
-Keep responses concise (2-3 sentences) unless asked for more detail.
-Use real business terminology and concepts relevant to your role."""
-
-    def think(self, topic: str, context: str = ""):
-        """Generate a response on a topic based on agent's expertise and personality."""
-        if not self.llm:
-            raise ValueError("LLM not initialized")
-        system_prompt = self.get_system_prompt()
+        if self.system_prompt is not None:
+            return self.system_prompt
+        return render_system_prompt(
+            self.name, self.role, self.expertise, self.personality, self.company
+        )
 
-        messages = [
-            SystemMessage(content=system_prompt),
+    def build_think_messages(self, topic: str, context: str = "") -> list[BaseMessage]:
+        """Build the prompt messages for a think turn."""
+        return [
+            SystemMessage(content=self.get_system_prompt()),
             HumanMessage(content=f"Topic: {topic}\n\nContext: {context}"),
         ]
 
-        response = self.llm.invoke(messages)
-        content = response.content
-        if isinstance(content, list):
-            return str(content[0]) if content else ""
-        return str(content)
-
-    def respond_to_colleague(
+    def build_response_messages(
         self, colleague_name: str, colleague_statement: str, topic: str
-    ):
-        """Respond to a colleague's statement during a meeting."""
-        if not self.llm:
-            raise ValueError("LLM not initialized")
-        system_prompt = self.get_system_prompt()
-
+    ) -> list[BaseMessage]:
+        """Build the prompt messages for a response to a colleague."""
         prompt = f"""Your colleague {colleague_name} just said:
 "{colleague_statement}"
 
@@ -72,19 +95,170 @@ You're discussing: {topic}
 Provide a thoughtful response that either builds on their idea, offers an alternative perspective, 
 or raises important considerations from your area of expertise."""
 
-        messages = [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+        return [SystemMessage(content=self.get_system_prompt()), HumanMessage(content=prompt)]
+
+    def think(
+        self,
+        topic: str,
+        context: str = "",
+        phase: str = "think",
+        on_token: Optional[Callable[[str], None]] = None,
+    ):
+        """Generate a response on a topic based on agent's expertise and personality.
+
+        If ``on_token`` is given, the response is streamed and each text
+        fragment is passed to it as it arrives.
+        """
+        if not self.llm:
+            raise ValueError("LLM not initialized")
+        return self._invoke(self.build_think_messages(topic, context), phase, on_token)
+
+    def respond_to_colleague(
+        self,
+        colleague_name: str,
+        colleague_statement: str,
+        topic: str,
+        phase: str = "response",
+        on_token: Optional[Callable[[str], None]] = None,
+    ):
+        """Respond to a colleague's statement during a meeting."""
+        if not self.llm:
+            raise ValueError("LLM not initialized")
+        messages = self.build_response_messages(
+            colleague_name, colleague_statement, topic
+        )
+        return self._invoke(messages, phase, on_token)
+
+    def complete(
+        self, messages: list[BaseMessage], phase: str, json_mode: bool = False
+    ) -> str:
+        """Send prebuilt messages through this agent's model, routing and hedging.
 
-        response = self.llm.invoke(messages)
-        content = response.content
-        if isinstance(content, list):
-            return str(content[0]) if content else ""
-        return str(content)
+        With ``json_mode`` the model is asked for a JSON object response.
+        """
+        if not self.llm:
+            raise ValueError("LLM not initialized")
+        return self._invoke(messages, phase, json_mode=json_mode)
+
+    def _invoke(
+        self,
+        messages: list[BaseMessage],
+        phase: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        json_mode: bool = False,
+    ) -> str:
+        """Send messages to the LLM selected for this turn and return the text."""
+        if self.tracer is None or not self.tracer.enabled:
+            return self._call_llm(messages, phase, on_token, json_mode)
+        with self.tracer.span(f"llm {phase}", "llm", agent=self.key or self.name) as span:
+            text = self._call_llm(messages, phase, on_token, json_mode)
+            span.set("model", self.last_call.model)
+            span.set("input_tokens", self.last_call.input_tokens)
+            span.set("output_tokens", self.last_call.output_tokens)
+            return text
+
+    def _scheduler_slot(self):
+        return self.scheduler.slot(self.meeting_id or self.name, self.priority)
+
+    def _call_llm(
+        self,
+        messages: list[BaseMessage],
+        phase: str,
+        on_token: Optional[Callable[[str], None]],
+        json_mode: bool = False,
+    ) -> str:
+        llm = self.llm
+        tier = None
+        fell_back = False
+        if self.router is not None:
+            tier, fell_back = self.router.route(self.key or self.name, phase, messages)
+            llm = self.router.get_llm(tier)
+
+        model = tier.model if tier is not None else llm.model_name
+        if json_mode:
+            llm = llm.bind(response_format={"type": "json_object"})
+        slot = self._scheduler_slot() if self.scheduler is not None else nullcontext()
+        with slot:
+            start = time.perf_counter()
+            try:
+                if on_token is not None:
+                    # Streamed turns are never hedged: only one stream can feed the speaker
+                    response = _stream(llm, messages, on_token)
+                elif self.hedger is not None:
+                    # A hedge takes a scheduler slot of its own
+                    response = self.hedger.invoke(
+                        llm,
+                        messages,
+                        model,
+                        hedge_slot=self._scheduler_slot if self.scheduler is not None else None,
+                    )
+                else:
+                    response = llm.invoke(messages)
+            except Exception:
+                if self.metrics is not None:
+                    self.metrics.record_error(self.key or self.name, phase)
+                raise
+            elapsed = time.perf_counter() - start
+
+        usage = getattr(response, "usage_metadata", None) or {}
+        if not usage and on_token is not None:
+            # Some servers ignore the request for usage on streams; estimate it
+            usage = {
+                "input_tokens": estimate_tokens(messages),
+                "output_tokens": len(response_text(response)) // 4,
+            }
+        self.last_call = CallRecord(
+            phase,
+            model,
+            elapsed,
+            usage.get("input_tokens", 0),
+            usage.get("output_tokens", 0),
+        )
+        if self.metrics is not None:
+            self.metrics.record_call(
+                self.key or self.name,
+                phase,
+                elapsed,
+                self.last_call.input_tokens,
+                self.last_call.output_tokens,
+                fell_back,
+            )
+        if tier is not None:
+            self.router.record(
+                self.key or self.name,
+                phase,
+                tier,
+                elapsed,
+                self.last_call.input_tokens,
+                self.last_call.output_tokens,
+                fell_back,
+            )
+        return response_text(response)
+
+
+def _stream(llm: ChatOpenAI, messages: list[BaseMessage], on_token: Callable[[str], None]):
+    """Stream a completion, passing text fragments on and returning the whole message."""
+    response = None
+    # Without stream_usage the final chunk carries no token counts
+    for chunk in llm.stream(messages, stream_usage=True):
+        if isinstance(chunk.content, str) and chunk.content:
+            on_token(chunk.content)
+        response = chunk if response is None else response + chunk
+    return response if response is not None else AIMessage(content="")
+
+
+def response_text(response) -> str:
+    """Extract the text content of a chat model response."""
+    content = response.content
+    if isinstance(content, list):
+        return str(content[0]) if content else ""
+    return str(content)
 
 
 class CEO(CorporateAgent):
     """Chief Executive Officer - focuses on overall vision and profitability."""
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
             name="Sarah Chen",
             role="Chief Executive Officer (CEO)",
@@ -95,13 +269,14 @@ class CEO(CorporateAgent):
                 "Business Growth",
             ],
             personality="Visionary, decisive, and focused on long-term value creation. Values strategic alignment and shareholder returns.",
+            **kwargs,
         )
 
 
 class CFO(CorporateAgent):
     """Chief Financial Officer - focuses on financial health and resource allocation."""
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
             name="Marcus Johnson",
             role="Chief Financial Officer (CFO)",
@@ -112,13 +287,14 @@ class CFO(CorporateAgent):
                 "ROI Analysis",
             ],
             personality="Data-driven, risk-conscious, and pragmatic. Ensures financial sustainability and scrutinizes spending.",
+            **kwargs,
         )
 
 
 class CTO(CorporateAgent):
     """Chief Technology Officer - focuses on technical innovation and infrastructure."""
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
             name="Priya Patel",
             role="Chief Technology Officer (CTO)",
@@ -129,13 +305,14 @@ class CTO(CorporateAgent):
                 "Tech Stack Selection",
             ],
             personality="Technically ambitious, forward-thinking, and passionate about cutting-edge solutions. Sometimes optimistic about timelines.",
+            **kwargs,
         )
 
 
 class COO(CorporateAgent):
     """Chief Operating Officer - focuses on execution and efficiency."""
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
             name="James Wilson",
             role="Chief Operating Officer (COO)",
@@ -146,13 +323,14 @@ class COO(CorporateAgent):
                 "Supply Chain",
             ],
             personality="Detail-oriented, process-focused, and pragmatic. Concerned with execution realities and team capabilities.",
+            **kwargs,
         )
 
 
 class VPMarketing(CorporateAgent):
     """VP of Marketing - focuses on market positioning and customer acquisition."""
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         super().__init__(
             name="Elena Rodriguez",
             role="Vice President of Marketing",
@@ -163,4 +341,5 @@ class VPMarketing(CorporateAgent):
                 "Product Launch",
             ],
             personality="Customer-centric, creative, and data-focused. Advocates for customer needs and market realities.",
+            **kwargs,
         )
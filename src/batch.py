@@ -0,0 +1,436 @@
+"""Offline bulk meetings through Batch-API-style JSONL rounds.
+
+Every turn whose prompt does not depend on another turn (opening remarks,
+topic openings, debate openers, round-table contributions, closing remarks)
+is exported in the first round. Each imported results file unlocks the
+turns that respond to those statements, which go out in the next round,
+until every meeting's transcript is complete.
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from langchain_openai import ChatOpenAI
+
+from agenda import DEFAULT_AGENDA, Agenda
+from metrics import MeetingMetrics
+from relevance import RelevanceIndex
+from scenario import cache_stats, load_scenario
+from team_meeting import CLOSING_PROMPT, create_default_team, opening_prompt
+from transcript import Transcript
+
+_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+
+@dataclass
+class BatchTurn:
+    """One agent turn of a meeting compiled for batch execution.
+
+    Attributes:
+        agent: Key of the speaking agent
+        phase: Meeting phase the turn belongs to
+        topic: Topic passed to ``think`` or ``respond_to_colleague``
+        reply_to: Index of the turn being responded to, or None for ``think``
+    """
+
+    agent: str
+    phase: str
+    topic: str
+    reply_to: Optional[int] = None
+
+
+def compile_agenda(
+    agenda: Agenda,
+    agent_keys: list[str],
+    chair: str = "ceo",
+    relevance: Optional[RelevanceIndex] = None,
+    relevance_threshold: float = 0.0,
+) -> list[BatchTurn]:
+    """Lay out a meeting's turns in transcript order with their dependencies.
+
+    With a relevance index, discussion respondents are chosen the way a live
+    TeamMeeting chooses them; without one they follow team order.
+    """
+    turns = [BatchTurn(chair, "opening", opening_prompt(agenda))]
+    for item in agenda.items:
+        if item.kind == "discussion":
+            opening = len(turns)
+            turns.append(BatchTurn(item.primary_speaker, "topic_opening", item.topic))
+            if relevance is not None:
+                respondents = relevance.rank(
+                    item.topic,
+                    item.num_responses,
+                    exclude=[item.primary_speaker],
+                    threshold=relevance_threshold,
+                )
+            else:
+                others = [key for key in agent_keys if key != item.primary_speaker]
+                respondents = others[: item.num_responses]
+            for key in respondents:
+                turns.append(BatchTurn(key, "response", item.topic, reply_to=opening))
+        elif item.kind == "debate":
+            # Offline debates always run to max_turns: batch rounds cannot
+            # stop a meeting early on convergence
+            turns.append(BatchTurn(item.side1, "debate", f"Argue for: {item.topic}"))
+            for turn in range(1, item.max_turns):
+                speaker = item.side2 if turn % 2 else item.side1
+                turns.append(
+                    BatchTurn(speaker, "debate", item.topic, reply_to=len(turns) - 1)
+                )
+        elif item.kind == "round_table":
+            for key in agent_keys:
+                turns.append(BatchTurn(key, "round_table", item.topic))
+    turns.append(BatchTurn(chair, "closing", CLOSING_PROMPT))
+    return turns
+
+
+class BatchMeetingRunner:
+    """Drives many meetings to completion through batch request rounds."""
+
+    def __init__(
+        self,
+        agendas: dict[str, Agenda],
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.7,
+        max_attempts: int = 3,
+        scenario_path: Optional[str] = None,
+        relevance_threshold: float = 0.0,
+    ):
+        """Initialize the runner.
+
+        Args:
+            agendas: Agenda per meeting id
+            model: Model name written into every request body
+            temperature: Sampling temperature for every request
+            max_attempts: Batch rounds a failing request is retried in
+            scenario_path: Scenario file whose team runs the meetings
+                (defaults to the TechVenture executives)
+            relevance_threshold: Minimum relevance score for a colleague to
+                respond in a discussion, as in TeamMeeting
+        """
+        self.scenario_path = scenario_path
+        # Agents here only render prompts; requests go out through JSONL files,
+        # so no API credentials are needed
+        llm = ChatOpenAI(model=model, api_key="offline-batch")
+        if scenario_path:
+            scenario = load_scenario(scenario_path)
+            self.agents = scenario.build_team(llm)
+            self.chair = scenario.chair
+        else:
+            self.agents = create_default_team(llm)
+            self.chair = "ceo"
+        self.agendas = dict(agendas)
+        self.model = model
+        self.temperature = temperature
+        self.max_attempts = max_attempts
+        self.relevance_threshold = relevance_threshold
+        relevance = RelevanceIndex(self.agents)
+        self.turns = {
+            meeting_id: compile_agenda(
+                agenda, list(self.agents), self.chair, relevance, relevance_threshold
+            )
+            for meeting_id, agenda in self.agendas.items()
+        }
+        self.results: dict[str, dict[int, str]] = {m: {} for m in self.agendas}
+        self.attempts: dict[str, int] = {}
+        self.failed: dict[str, str] = {}
+        self.rounds = 0
+
+    def ready_turns(self) -> list[tuple[str, int]]:
+        """Turns whose dependencies are answered but which have no result yet."""
+        ready = []
+        for meeting_id, turns in self.turns.items():
+            if meeting_id in self.failed:
+                continue
+            results = self.results[meeting_id]
+            for index, turn in enumerate(turns):
+                if index in results:
+                    continue
+                if turn.reply_to is None or turn.reply_to in results:
+                    ready.append((meeting_id, index))
+        return ready
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.ready_turns()
+
+    def _messages(self, meeting_id: str, index: int):
+        turn = self.turns[meeting_id][index]
+        agent = self.agents[turn.agent]
+        if turn.reply_to is None:
+            return agent.build_think_messages(turn.topic)
+        colleague = self.agents[self.turns[meeting_id][turn.reply_to].agent]
+        statement = self.results[meeting_id][turn.reply_to]
+        return agent.build_response_messages(colleague.name, statement, turn.topic)
+
+    def export_round(self, path: str) -> int:
+        """Write the next round of requests as Batch API JSONL.
+
+        Returns:
+            Number of requests written
+        """
+        ready = self.ready_turns()
+        with open(path, "w") as f:
+            for meeting_id, index in ready:
+                messages = [
+                    {"role": _ROLES[message.type], "content": message.content}
+                    for message in self._messages(meeting_id, index)
+                ]
+                request = {
+                    "custom_id": f"{meeting_id}:{index}",
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": self.model,
+                        "temperature": self.temperature,
+                        "messages": messages,
+                    },
+                }
+                f.write(json.dumps(request) + "\n")
+        self.rounds += 1
+        return len(ready)
+
+    def import_results(self, path: str) -> int:
+        """Read a Batch API results file and record successful turns.
+
+        Failed requests are retried in the next round until ``max_attempts``
+        is reached, after which their meeting is marked failed.
+
+        Returns:
+            Number of turns answered
+        """
+        answered = 0
+        with open(path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                custom_id = record["custom_id"]
+                meeting_id, index = custom_id.rsplit(":", 1)
+                if meeting_id not in self.results:
+                    continue
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    body = response["body"]
+                    content = body["choices"][0]["message"]["content"] or ""
+                    self.results[meeting_id][int(index)] = content
+                    answered += 1
+                    continue
+
+                self.attempts[custom_id] = self.attempts.get(custom_id, 0) + 1
+                if self.attempts[custom_id] >= self.max_attempts:
+                    error = record.get("error") or response.get("body")
+                    self.failed[meeting_id] = f"{custom_id}: {error}"
+        return answered
+
+    def transcript(self, meeting_id: str) -> Transcript:
+        """Transcript of a meeting's answered turns, as a live meeting records it."""
+        transcript = Transcript()
+        for index, turn in enumerate(self.turns[meeting_id]):
+            if index in self.results[meeting_id]:
+                role = self.agents[turn.agent].role
+                transcript.append(turn.agent, role, self.results[meeting_id][index], turn.phase)
+        return transcript
+
+    def save_transcripts(self, directory: str):
+        """Write one transcript file per completed meeting."""
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        for meeting_id in self.agendas:
+            if meeting_id in self.failed:
+                continue
+            with open(out / f"{meeting_id}.txt", "w") as f:
+                self.transcript(meeting_id).write(f)
+
+    def run(self, endpoint: "LocalBatchEndpoint", workdir: str) -> int:
+        """Run export/execute/import rounds against an endpoint until done.
+
+        Returns:
+            Number of rounds executed
+        """
+        work = Path(workdir)
+        work.mkdir(parents=True, exist_ok=True)
+        rounds = 0
+        while not self.is_complete:
+            rounds += 1
+            requests = work / f"round_{self.rounds + 1}_requests.jsonl"
+            results = work / f"round_{self.rounds + 1}_results.jsonl"
+            retries = sum(self.attempts.values())
+            self.export_round(str(requests))
+            endpoint.process(str(requests), str(results))
+            answered = self.import_results(str(results))
+            if not answered and sum(self.attempts.values()) == retries:
+                # The endpoint returned nothing for this round
+                break
+        return rounds
+
+    def save_state(self, path: str):
+        """Persist progress so the next round can run in a new process."""
+        state = {
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_attempts": self.max_attempts,
+            "scenario_path": self.scenario_path,
+            "relevance_threshold": self.relevance_threshold,
+            "rounds": self.rounds,
+            "agendas": {m: a.to_dict() for m, a in self.agendas.items()},
+            "results": self.results,
+            "attempts": self.attempts,
+            "failed": self.failed,
+        }
+        with open(path, "w") as f:
+            json.dump(state, f)
+
+    @classmethod
+    def load_state(cls, path: str) -> "BatchMeetingRunner":
+        """Restore a runner saved with ``save_state``."""
+        with open(path) as f:
+            state = json.load(f)
+        runner = cls(
+            {m: Agenda.from_dict(a) for m, a in state["agendas"].items()},
+            model=state["model"],
+            temperature=state["temperature"],
+            max_attempts=state["max_attempts"],
+            scenario_path=state.get("scenario_path"),
+            relevance_threshold=state.get("relevance_threshold", 0.0),
+        )
+        runner.rounds = state["rounds"]
+        runner.results = {
+            m: {int(i): text for i, text in results.items()}
+            for m, results in state["results"].items()
+        }
+        runner.attempts = state["attempts"]
+        runner.failed = state["failed"]
+        return runner
+
+
+def simulated_reply(body: dict) -> str:
+    """Placeholder completion used when no real responder is configured."""
+    prompt = body["messages"][-1]["content"]
+    return f"(simulated reply to: {prompt.splitlines()[0][:80]})"
+
+
+def chat_reply(body: dict) -> str:
+    """Execute a batch request body synchronously with ChatOpenAI."""
+    from langchain_openai import ChatOpenAI
+
+    llm = ChatOpenAI(model=body["model"], temperature=body.get("temperature", 0.7))
+    response = llm.invoke([(m["role"], m["content"]) for m in body["messages"]])
+    return str(response.content)
+
+
+class LocalBatchEndpoint:
+    """File-based stand-in for the OpenAI Batch API."""
+
+    def __init__(self, responder: Optional[Callable[[dict], str]] = None):
+        """Initialize the endpoint.
+
+        Args:
+            responder: Produces completion text for a request body; defaults
+                to ``simulated_reply``
+        """
+        self.responder = responder or simulated_reply
+
+    def process(self, input_path: str, output_path: str) -> int:
+        """Answer every request in a batch input file.
+
+        Returns:
+            Number of requests processed
+        """
+        count = 0
+        with open(input_path) as src, open(output_path, "w") as dst:
+            for line in src:
+                if not line.strip():
+                    continue
+                request = json.loads(line)
+                record = {"id": f"batch_req_{count}", "custom_id": request["custom_id"]}
+                try:
+                    content = self.responder(request["body"])
+                    record["response"] = {
+                        "status_code": 200,
+                        "body": {
+                            "model": request["body"]["model"],
+                            "choices": [
+                                {
+                                    "index": 0,
+                                    "message": {"role": "assistant", "content": content},
+                                    "finish_reason": "stop",
+                                }
+                            ],
+                        },
+                    }
+                    record["error"] = None
+                except Exception as e:
+                    record["response"] = None
+                    record["error"] = {"code": type(e).__name__, "message": str(e)}
+                dst.write(json.dumps(record) + "\n")
+                count += 1
+        return count
+
+
+def main():
+    """Export, import or simulate batch meeting rounds from the command line."""
+    parser = argparse.ArgumentParser(description="Run meetings in batch rounds.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    init_cmd = sub.add_parser("init", help="Create a state file for N meetings")
+    init_cmd.add_argument("state")
+    init_cmd.add_argument("--meetings", type=int, default=1)
+    init_cmd.add_argument("--scenario", help="Scenario file (TOML/JSON) with team and agenda")
+
+    export_cmd = sub.add_parser("export", help="Write the next round of requests")
+    export_cmd.add_argument("state")
+    export_cmd.add_argument("requests")
+
+    import_cmd = sub.add_parser("import", help="Ingest a results file")
+    import_cmd.add_argument("state")
+    import_cmd.add_argument("results")
+    import_cmd.add_argument("--transcripts", default="batch_transcripts")
+
+    sim_cmd = sub.add_parser("simulate", help="Run all rounds against the local endpoint")
+    sim_cmd.add_argument("state")
+    sim_cmd.add_argument("--workdir", default="batch_rounds")
+    sim_cmd.add_argument("--transcripts", default="batch_transcripts")
+    sim_cmd.add_argument("--live", action="store_true", help="Call ChatOpenAI per request")
+    for cmd in (import_cmd, sim_cmd):
+        cmd.add_argument("--metrics-file", help="Write Prometheus metrics to this file")
+    args = parser.parse_args()
+
+    if args.command == "init":
+        agenda = load_scenario(args.scenario).agenda if args.scenario else DEFAULT_AGENDA
+        agendas = {f"meeting_{i:04d}": agenda for i in range(args.meetings)}
+        BatchMeetingRunner(agendas, scenario_path=args.scenario).save_state(args.state)
+        print(f"Initialized {args.meetings} meetings in {args.state}")
+        return
+
+    runner = BatchMeetingRunner.load_state(args.state)
+    if args.command == "export":
+        count = runner.export_round(args.requests)
+        print(f"Round {runner.rounds}: wrote {count} requests to {args.requests}")
+    elif args.command == "import":
+        count = runner.import_results(args.results)
+        print(f"Recorded {count} turns from {args.results}")
+        if runner.is_complete:
+            runner.save_transcripts(args.transcripts)
+            print(f"All meetings complete; transcripts in {args.transcripts}")
+    elif args.command == "simulate":
+        endpoint = LocalBatchEndpoint(chat_reply if args.live else None)
+        rounds = runner.run(endpoint, args.workdir)
+        runner.save_transcripts(args.transcripts)
+        print(f"Completed in {rounds} rounds; transcripts in {args.transcripts}")
+    runner.save_state(args.state)
+    if getattr(args, "metrics_file", None):
+        metrics = MeetingMetrics()
+        metrics.watch_batch_runner(runner)
+        metrics.watch_scenario_cache(cache_stats)
+        metrics.registry.write(args.metrics_file)
+
+    for meeting_id, error in runner.failed.items():
+        print(f"Meeting {meeting_id} failed: {error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,327 @@
+"""What-if meetings that share their common prefix and fork into variants.
+
+A branching meeting is a tree of Branch nodes. Each branch runs its own
+agenda items once; its children continue from the state it ends in, so
+turns shared by several variants are generated a single time. Sibling
+branches run concurrently, and only leaves deliver closing remarks.
+
+Forks happen at agenda item boundaries. Later turns do not read earlier
+transcript text directly; they only see the running summary, if there is
+one. A forked meeting therefore starts from a copy of the parent's
+summary and an empty transcript of its own, and the full transcript of a
+leaf is the concatenation along its path.
+"""
+
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from agenda import Agenda, AgendaItem
+from agents import render_system_prompt
+from relevance import RelevanceIndex
+from team_meeting import TeamMeeting
+from transcript import Transcript
+
+PERSONA_FIELDS = ("name", "role", "expertise", "personality", "system_prompt")
+
+
+@dataclass(frozen=True)
+class Branch:
+    """A segment of a what-if meeting and the variants that fork after it."""
+
+    name: str
+    items: tuple[AgendaItem, ...] = ()
+    personas: dict = field(default_factory=dict)
+    branches: tuple["Branch", ...] = ()
+
+
+@dataclass
+class BranchNode:
+    """The turns one branch generated, linked into the result tree."""
+
+    name: str
+    transcript: Transcript
+    personas: dict
+    parent: Optional["BranchNode"] = None
+    children: list["BranchNode"] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def turns(self) -> int:
+        return len(self.transcript)
+
+    @property
+    def tokens(self) -> int:
+        return sum(self.transcript.tokens)
+
+    @property
+    def latency(self) -> float:
+        return sum(self.transcript.latency)
+
+    def path(self) -> list["BranchNode"]:
+        """Nodes from the root down to this one."""
+        nodes = []
+        node = self
+        while node is not None:
+            nodes.append(node)
+            node = node.parent
+        return nodes[::-1]
+
+    def leaves(self) -> list["BranchNode"]:
+        """Leaf nodes under this one, in branch order."""
+        if not self.children:
+            return [self]
+        return [leaf for child in self.children for leaf in child.leaves()]
+
+    def walk(self):
+        """Yield this node and every descendant, depth first."""
+        yield self
+        for child in self.children:
+            yield from child.walk()
+
+    def write(self, f):
+        """Write the full transcript along the path from the root to this node."""
+        first = True
+        for node in self.path():
+            for entry in node.transcript:
+                if not first:
+                    f.write("\n")
+                f.write(entry)
+                first = False
+
+    def to_dict(self) -> dict:
+        """The tree's structure and per-branch cost as JSON-serializable data."""
+        return {
+            "name": self.name,
+            "personas": self.personas,
+            "turns": self.turns,
+            "tokens": self.tokens,
+            "latency": round(self.latency, 3),
+            "error": self.error,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+def what_if(
+    agenda: Agenda,
+    fork_after: int,
+    variants: dict[str, dict],
+) -> Branch:
+    """Build a two-level tree: a shared agenda prefix and one branch per variant.
+
+    Args:
+        agenda: The base meeting agenda
+        fork_after: Number of agenda items shared by every variant
+        variants: Variant name to options: ``items`` (replacement agenda
+            items after the fork, defaulting to the rest of the agenda) and
+            ``personas`` (agent key to persona field overrides)
+    """
+    if not 0 <= fork_after <= len(agenda.items):
+        raise ValueError(f"fork_after must be between 0 and {len(agenda.items)}")
+    rest = agenda.items[fork_after:]
+    return Branch(
+        name="shared",
+        items=agenda.items[:fork_after],
+        branches=tuple(
+            Branch(
+                name=name,
+                items=tuple(options.get("items", rest)),
+                personas=dict(options.get("personas", {})),
+            )
+            for name, options in variants.items()
+        ),
+    )
+
+
+class BranchingMeeting:
+    """Runs a Branch tree, generating each shared segment once."""
+
+    def __init__(
+        self,
+        meeting_factory: Callable[[], TeamMeeting],
+        title: str = "WHAT-IF MEETING",
+        max_workers: Optional[int] = None,
+    ):
+        """Initialize the runner.
+
+        Args:
+            meeting_factory: Creates a fresh TeamMeeting for each branch.
+                Use ``verbose=False``, since sibling branches run at once
+            title: Meeting title; the opening lists every variant's items
+            max_workers: Sibling branches run at once (default: all)
+        """
+        self.meeting_factory = meeting_factory
+        self.title = title
+        self.max_workers = max_workers
+
+    def run(self, root: Branch) -> BranchNode:
+        """Run the opening, then every branch; return the result tree.
+
+        Raises:
+            ValueError: If a persona override names an unknown agent or field
+        """
+        meeting = self.meeting_factory()
+        _check_personas(root, meeting.agents)
+        opening = Agenda(self.title, _tree_items(root))
+        return self._run_branch(meeting, root, {}, None, opening)
+
+    def _run_branch(
+        self,
+        meeting: TeamMeeting,
+        branch: Branch,
+        personas: dict,
+        parent: Optional[BranchNode],
+        opening: Optional[Agenda] = None,
+    ) -> BranchNode:
+        personas = _merge_personas(personas, branch.personas)
+        node = BranchNode(branch.name, meeting.meeting_transcript, personas, parent)
+        # Each branch's meeting counts as a meeting, as with run_agenda
+        if meeting.metrics:
+            meeting.metrics.meeting_started()
+        try:
+            if opening is not None:
+                meeting.open_meeting(agenda=opening)
+            _apply_personas(meeting, branch.personas)
+            for item in branch.items:
+                meeting.run_item(item)
+            if not branch.branches:
+                meeting.closing_remarks()
+        except Exception as e:
+            node.error = f"{type(e).__name__}: {e}"
+            if meeting.metrics:
+                meeting.metrics.meeting_finished("failed")
+            return node
+        finally:
+            # Forks continue in meetings of their own
+            if meeting.scheduler:
+                meeting.scheduler.release(meeting.meeting_id)
+            if meeting.summarizer:
+                # Forks start from a copy of the finished summary
+                meeting.summarizer.close()
+        if meeting.metrics:
+            meeting.metrics.meeting_finished()
+
+        if branch.branches:
+            workers = self.max_workers or len(branch.branches)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="branch") as pool:
+                futures = [
+                    pool.submit(self._fork, meeting, child, personas, node)
+                    for child in branch.branches
+                ]
+                node.children = [future.result() for future in futures]
+        return node
+
+    def _fork(
+        self,
+        parent_meeting: TeamMeeting,
+        branch: Branch,
+        personas: dict,
+        parent: BranchNode,
+    ) -> BranchNode:
+        try:
+            meeting = self.meeting_factory()
+            _apply_personas(meeting, personas)
+        except Exception as e:
+            # Record the failure without losing the sibling branches
+            node = BranchNode(branch.name, Transcript(), personas, parent)
+            node.error = f"{type(e).__name__}: {e}"
+            return node
+        if parent_meeting.summarizer and meeting.summarizer:
+            meeting.summarizer.summary = parent_meeting.summarizer.current()
+        return self._run_branch(meeting, branch, personas, parent)
+
+    def save(self, root: BranchNode, directory: str):
+        """Write ``tree.json`` and one full transcript file per leaf."""
+        out = Path(directory)
+        out.mkdir(parents=True, exist_ok=True)
+        with open(out / "tree.json", "w") as f:
+            json.dump(root.to_dict(), f, indent=2)
+        for leaf in root.leaves():
+            filename = "__".join(_slug(node.name) for node in leaf.path()) + ".txt"
+            with open(out / filename, "w") as f:
+                leaf.write(f)
+
+
+def apply_persona(agent, overrides: dict):
+    """Override persona fields on an agent, re-rendering a precompiled prompt."""
+    unknown = set(overrides) - set(PERSONA_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown persona fields: {', '.join(sorted(unknown))}")
+    for name, value in overrides.items():
+        setattr(agent, name, value)
+    if agent.system_prompt is not None and "system_prompt" not in overrides:
+        agent.system_prompt = render_system_prompt(
+            agent.name, agent.role, agent.expertise, agent.personality, agent.company
+        )
+
+
+def branch_report(root: BranchNode) -> str:
+    """Compare the tree's cost with rerunning every variant from scratch."""
+    lines = [f"{'branch':<30} {'turns':>6} {'tokens':>8} {'llm s':>8}"]
+    for node in root.walk():
+        depth = len(node.path()) - 1
+        label = ("  " * depth + node.name)[:30]
+        suffix = f"  error: {node.error}" if node.error else ""
+        lines.append(f"{label:<30} {node.turns:>6} {node.tokens:>8} {node.latency:>8.2f}{suffix}")
+    nodes = list(root.walk())
+    tree_turns = sum(node.turns for node in nodes)
+    tree_tokens = sum(node.tokens for node in nodes)
+    leaves = root.leaves()
+    rerun_turns = sum(node.turns for leaf in leaves for node in leaf.path())
+    rerun_tokens = sum(node.tokens for leaf in leaves for node in leaf.path())
+    saved = 1 - tree_turns / rerun_turns if rerun_turns else 0.0
+    lines.append(
+        f"variants={len(leaves)} calls={tree_turns} (independent reruns: {rerun_turns}) "
+        f"tokens={tree_tokens} (independent reruns: {rerun_tokens}) calls_saved={saved:.0%}"
+    )
+    return "\n".join(lines)
+
+
+def _check_personas(root: Branch, agents: dict):
+    stack = [root]
+    while stack:
+        branch = stack.pop()
+        for key, overrides in branch.personas.items():
+            if key not in agents:
+                raise ValueError(f"Branch '{branch.name}' overrides unknown agent '{key}'")
+            unknown = set(overrides) - set(PERSONA_FIELDS)
+            if unknown:
+                raise ValueError(
+                    f"Branch '{branch.name}' overrides unknown persona fields: "
+                    f"{', '.join(sorted(unknown))}"
+                )
+        stack.extend(branch.branches)
+
+
+def _apply_personas(meeting: TeamMeeting, personas: dict):
+    if not personas:
+        return
+    for key, overrides in personas.items():
+        apply_persona(meeting.agents[key], overrides)
+    # Expertise and roles may have changed
+    meeting.relevance = RelevanceIndex(meeting.agents)
+
+
+def _tree_items(root: Branch) -> tuple[AgendaItem, ...]:
+    # Every item any variant discusses, in depth-first order
+    items: list[AgendaItem] = []
+    stack = [root]
+    while stack:
+        branch = stack.pop()
+        items.extend(item for item in branch.items if item not in items)
+        stack.extend(reversed(branch.branches))
+    return tuple(items)
+
+
+def _merge_personas(base: dict, overrides: dict) -> dict:
+    merged = {key: dict(fields) for key, fields in base.items()}
+    for key, fields in overrides.items():
+        merged.setdefault(key, {}).update(fields)
+    return merged
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or "branch"
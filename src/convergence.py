@@ -0,0 +1,154 @@
+"""Cheap local detection of debates that have stopped moving."""
+
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+_WORD = re.compile(r"[a-z0-9']+")
+
+AGREEMENT_MARKERS = (
+    "i agree",
+    "we agree",
+    "i concur",
+    "you're right",
+    "you are right",
+    "fair point",
+    "common ground",
+    "we're aligned",
+    "we are aligned",
+    "in agreement",
+    "meet in the middle",
+    "let's move forward with",
+)
+
+
+def shingles(text: str, size: int = 3) -> set[tuple[str, ...]]:
+    """Word n-grams of a statement, lowercased and stripped of punctuation."""
+    words = _WORD.findall(text.lower())
+    if len(words) < size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def jaccard(a: set, b: set) -> float:
+    """Jaccard similarity of two sets (0.0 when both are empty)."""
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def agreement_count(text: str, markers: tuple[str, ...] = AGREEMENT_MARKERS) -> int:
+    """Number of agreement phrases in a statement."""
+    lowered = text.lower()
+    return sum(lowered.count(marker) for marker in markers)
+
+
+class ConvergenceDetector:
+    """Decides when a debate has converged or started repeating itself.
+
+    Three signals are checked after every turn, all computed locally from
+    the statements so far:
+
+    * repetition: a speaker's latest statement is close to their previous one
+    * convergence: the two latest statements, one per side, largely overlap
+    * agreement: both sides' latest statements contain agreement phrases
+    """
+
+    def __init__(
+        self,
+        repetition_threshold: float = 0.5,
+        convergence_threshold: float = 0.35,
+        shingle_size: int = 3,
+        min_turns: int = 3,
+        markers: tuple[str, ...] = AGREEMENT_MARKERS,
+    ):
+        """Initialize the detector.
+
+        Args:
+            repetition_threshold: Shingle similarity between a speaker's last
+                two statements at which the debate counts as repeating
+            convergence_threshold: Shingle similarity between the two sides'
+                latest statements at which positions count as converged
+            shingle_size: Words per shingle
+            min_turns: Turns always played before stopping early
+            markers: Phrases that signal agreement
+        """
+        self.repetition_threshold = repetition_threshold
+        self.convergence_threshold = convergence_threshold
+        self.shingle_size = shingle_size
+        self.min_turns = min_turns
+        self.markers = markers
+
+    def check(self, statements: list[str]) -> Optional[str]:
+        """Return why the debate should stop, or None to keep going."""
+        if len(statements) < max(self.min_turns, 2):
+            return None
+        latest = shingles(statements[-1], self.shingle_size)
+        if len(statements) >= 3:
+            own_previous = shingles(statements[-3], self.shingle_size)
+            if jaccard(latest, own_previous) >= self.repetition_threshold:
+                return "repetition"
+        other_side = shingles(statements[-2], self.shingle_size)
+        if jaccard(latest, other_side) >= self.convergence_threshold:
+            return "convergence"
+        if agreement_count(statements[-1], self.markers) and agreement_count(
+            statements[-2], self.markers
+        ):
+            return "agreement"
+        return None
+
+
+@dataclass
+class DebateOutcome:
+    """How far a debate ran before it stopped, and what stopping saved."""
+
+    topic: str
+    max_turns: int
+    turns: int
+    stop_reason: str
+    mean_turn_latency: float
+    synthesis: str = ""
+    synthesis_latency: float = 0.0
+
+    @property
+    def calls(self) -> int:
+        """LLM calls made, including the synthesized outcome."""
+        return self.turns + (1 if self.synthesis else 0)
+
+    @property
+    def turns_saved(self) -> int:
+        return self.max_turns - self.turns
+
+    @property
+    def calls_saved(self) -> int:
+        """Calls saved net of the synthesis call; negative if the debate ran out."""
+        return self.max_turns - self.calls
+
+    @property
+    def latency_saved(self) -> float:
+        """Estimated seconds saved net of the synthesis, at the mean turn latency."""
+        return self.turns_saved * self.mean_turn_latency - self.synthesis_latency
+
+
+def debate_report(outcomes: list[DebateOutcome]) -> str:
+    """Format per-debate call counts and estimated net savings as a table.
+
+    Savings are net of the extra synthesis call, so a debate that runs to
+    ``max_turns`` shows -1 calls saved.
+    """
+    lines = [
+        f"{'topic':<40} {'turns':>5} {'max':>4} {'saved':>5} {'saved s':>8}  stop"
+    ]
+    for outcome in outcomes:
+        lines.append(
+            f"{outcome.topic[:40]:<40} {outcome.turns:>5} {outcome.max_turns:>4} "
+            f"{outcome.calls_saved:>5} {outcome.latency_saved:>8.2f}  {outcome.stop_reason}"
+        )
+    total_calls = sum(outcome.calls for outcome in outcomes)
+    total_saved = sum(outcome.calls_saved for outcome in outcomes)
+    total_seconds = sum(outcome.latency_saved for outcome in outcomes)
+    lines.append(
+        f"debates={len(outcomes)} calls={total_calls} calls_saved={total_saved} "
+        f"est_latency_saved={total_seconds:.2f}s"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,258 @@
+"""Request hedging to cut tail latency of agent LLM calls."""
+
+import asyncio
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Callable, ContextManager, Optional
+
+from routing import LatencyTracker, percentile
+
+
+@dataclass
+class HedgeStats:
+    """Counters and latency samples collected by a HedgePolicy."""
+
+    calls: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    budget_denied: int = 0
+    observed: list[float] = field(default_factory=list)
+    primary: list[float] = field(default_factory=list)
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedges / self.calls if self.calls else 0.0
+
+    @property
+    def hedge_win_rate(self) -> float:
+        return self.hedge_wins / self.hedges if self.hedges else 0.0
+
+    def tail_improvement(self, q: float = 0.99) -> float:
+        """Seconds shaved off the q-th percentile compared with primaries alone.
+
+        Only meaningful when the policy measures losers; otherwise primaries
+        that lost a hedge race have no latency sample.
+        """
+        unhedged = percentile(self.primary, q)
+        hedged = percentile(self.observed, q)
+        if unhedged is None or hedged is None:
+            return 0.0
+        return unhedged - hedged
+
+
+class HedgePolicy:
+    """Issues a duplicate request when a call outlives a latency percentile.
+
+    The hedge delay for each model is the ``percentile`` of its recent
+    latencies. Once a call has been pending that long, a second identical
+    request is sent and the first successful response wins; the loser is
+    cancelled. Hedges are capped at ``max_hedge_ratio`` of all calls.
+
+    The delay estimate only ever sees the primary request's own latency,
+    never the shortened latency a winning hedge gives the caller. A
+    cancelled primary is recorded at the time it was cancelled, a lower
+    bound that is always above the delay in force, so hedging cannot pull
+    its own percentile down.
+
+    Streamed calls (with a token callback) are never hedged: two streams
+    cannot feed one speaker.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_samples: int = 10,
+        max_hedge_ratio: float = 0.1,
+        min_delay: float = 0.5,
+        measure_losers: bool = False,
+    ):
+        """Initialize the hedging policy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is issued
+            min_samples: Samples per model required before hedging starts
+            max_hedge_ratio: Maximum fraction of calls that may be hedged
+            min_delay: Lower bound on the hedge delay in seconds
+            measure_losers: Opt in to letting losing primaries finish
+                (paying for both requests, without using the loser's
+                result) so the unhedged latency is measured exactly and
+                the report can include the p99 improvement
+        """
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_delay = min_delay
+        self.measure_losers = measure_losers
+        # Primary-request latencies per model; sets the hedge delay
+        self.latency = LatencyTracker()
+        self.stats = HedgeStats()
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def hedge_delay(self, model: str) -> Optional[float]:
+        """Seconds to wait before hedging a call, or None while warming up."""
+        if self.latency.count(model) < self.min_samples:
+            return None
+        delay = self.latency.percentile(model, self.percentile)
+        return max(self.min_delay, delay) if delay is not None else None
+
+    def invoke(
+        self,
+        llm,
+        messages,
+        model: str,
+        hedge_slot: Optional[Callable[[], ContextManager]] = None,
+    ):
+        """Invoke the LLM, hedging the request if it runs past the delay.
+
+        Args:
+            llm: Chat model to invoke
+            messages: Prompt messages
+            model: Model name the latency is tracked under
+            hedge_slot: Returns a context manager held while the hedge
+                request runs, such as a second scheduler slot
+        """
+        delay = self.hedge_delay(model)
+        start = time.perf_counter()
+        if delay is None:
+            response = llm.invoke(messages)
+            elapsed = time.perf_counter() - start
+            self._record(model, elapsed, elapsed, False)
+            return response
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._race(llm, messages, delay, model, start, hedge_slot), self._event_loop()
+        )
+        return future.result()
+
+    async def _race(
+        self,
+        llm,
+        messages,
+        delay: float,
+        model: str,
+        start: float,
+        hedge_slot: Optional[Callable[[], ContextManager]],
+    ):
+        primary = asyncio.ensure_future(llm.ainvoke(messages))
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if not done and self._take_budget():
+            slot = await self._acquire(hedge_slot, primary)
+            if slot is not None:
+                return await self._hedge(llm, messages, model, start, primary, slot)
+            self._refund_budget()
+        response = await primary
+        elapsed = time.perf_counter() - start
+        self._record(model, elapsed, elapsed, False)
+        return response
+
+    async def _acquire(self, hedge_slot, primary: asyncio.Future):
+        """Enter the hedge's slot, or return None if the primary finishes first."""
+        if hedge_slot is None:
+            return nullcontext()
+        slot = hedge_slot()
+        entering = asyncio.get_running_loop().run_in_executor(None, slot.__enter__)
+        done, _ = await asyncio.wait({primary, entering}, return_when=asyncio.FIRST_COMPLETED)
+        if entering in done:
+            entering.result()
+            if primary not in done:
+                return slot
+            slot.__exit__(None, None, None)
+            return None
+        # Give the slot back as soon as it is granted
+        entering.add_done_callback(
+            lambda f: f.exception() is None and slot.__exit__(None, None, None)
+        )
+        return None
+
+    async def _hedge(self, llm, messages, model: str, start: float, primary, slot):
+        hedge = asyncio.ensure_future(llm.ainvoke(messages))
+        hedge.add_done_callback(lambda _: slot.__exit__(None, None, None))
+        pending = {primary, hedge}
+        winner = None
+        while pending and winner is None:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Both may finish in the same round; prefer the primary if it succeeded
+            for task in (primary, hedge):
+                if task in done and task.exception() is None:
+                    winner = task
+                    break
+        if winner is None:
+            # Every request failed
+            raise primary.exception()
+
+        elapsed = time.perf_counter() - start
+        for task in pending:
+            if self.measure_losers and task is primary:
+                task.add_done_callback(
+                    lambda task, s=start: self._record_primary(
+                        model, task, time.perf_counter() - s
+                    )
+                )
+            else:
+                task.cancel()
+
+        hedge_won = winner is hedge
+        if hedge_won and primary in pending and not self.measure_losers:
+            # Cancelled primary: it ran at least this long
+            self.latency.record(model, elapsed)
+        # A measured losing primary is recorded when it finishes
+        primary_latency = None if hedge_won else elapsed
+        self._record(model, elapsed, primary_latency, hedge_won)
+        return winner.result()
+
+    def _take_budget(self) -> bool:
+        with self._lock:
+            if self.stats.hedges + 1 > self.max_hedge_ratio * max(self.stats.calls, 1):
+                self.stats.budget_denied += 1
+                return False
+            self.stats.hedges += 1
+            return True
+
+    def _refund_budget(self):
+        with self._lock:
+            self.stats.hedges -= 1
+
+    def _record(
+        self, model: str, elapsed: float, primary_latency: Optional[float], hedge_won: bool
+    ):
+        if primary_latency is not None:
+            self.latency.record(model, primary_latency)
+        with self._lock:
+            self.stats.calls += 1
+            self.stats.hedge_wins += int(hedge_won)
+            self.stats.observed.append(elapsed)
+            if primary_latency is not None:
+                self.stats.primary.append(primary_latency)
+
+    def _record_primary(self, model: str, task: asyncio.Future, latency: float):
+        if task.cancelled() or task.exception() is not None:
+            return
+        self.latency.record(model, latency)
+        with self._lock:
+            self.stats.primary.append(latency)
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever, name="hedge-loop", daemon=True
+                ).start()
+            return self._loop
+
+    def report(self) -> str:
+        """Summarize hedge rate and tail latency."""
+        stats = self.stats
+        p50 = percentile(stats.observed, 0.5) or 0.0
+        p99 = percentile(stats.observed, 0.99) or 0.0
+        report = (
+            f"calls={stats.calls} hedges={stats.hedges} "
+            f"hedge_rate={stats.hedge_rate:.1%} hedge_wins={stats.hedge_wins} "
+            f"budget_denied={stats.budget_denied} p50={p50:.2f}s p99={p99:.2f}s"
+        )
+        if self.measure_losers:
+            report += f" p99_improvement={stats.tail_improvement():.2f}s"
+        return report
@@ -0,0 +1,466 @@
+"""In-process metrics exposed in the Prometheus text exposition format."""
+
+import bisect
+import math
+import os
+import threading
+import weakref
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Optional
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 32.0, 64.0)
+
+
+class _Metric:
+    """A named metric family with one child per label value combination."""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """Return the child for these label values, creating it on first use."""
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _samples(self) -> list[tuple[str, tuple, float]]:
+        """(suffix, label pairs, value) for every sample of the family."""
+        raise NotImplementedError
+
+    def _label_pairs(self, values: tuple) -> tuple:
+        return tuple(zip(self.labelnames, values))
+
+
+class _Value:
+    """Counter or gauge child."""
+
+    __slots__ = ("value", "_lock")
+
+    def __init__(self, lock: threading.Lock):
+        self.value = 0.0
+        self._lock = lock
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        with self._lock:
+            self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, such as calls or tokens."""
+
+    kind = "counter"
+
+    def _new_child(self):
+        return _Value(self._lock)
+
+    def inc(self, amount: float = 1.0):
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+    def _samples(self):
+        return [("_total", self._label_pairs(v), c.value) for v, c in list(self._children.items())]
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, such as meetings in flight."""
+
+    kind = "gauge"
+
+    def _new_child(self):
+        return _Value(self._lock)
+
+    def inc(self, amount: float = 1.0):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def _samples(self):
+        return [("", self._label_pairs(v), c.value) for v, c in list(self._children.items())]
+
+
+class _HistogramChild:
+    __slots__ = ("bounds", "counts", "sum", "count", "_lock")
+
+    def __init__(self, bounds: tuple[float, ...], lock: threading.Lock):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self._lock = lock
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+
+class Histogram(_Metric):
+    """Observations counted into fixed buckets, such as call latencies."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets, self._lock)
+
+    def observe(self, value: float):
+        """Observe a value on the unlabelled histogram."""
+        self.labels().observe(value)
+
+    def _samples(self):
+        samples = []
+        for values, child in list(self._children.items()):
+            pairs = self._label_pairs(values)
+            with self._lock:
+                counts, total, count = list(child.counts), child.sum, child.count
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                samples.append(("_bucket", pairs + (("le", _format_value(bound)),), cumulative))
+            samples.append(("_sum", pairs, total))
+            samples.append(("_count", pairs, count))
+        return samples
+
+
+class CallbackMetric(_Metric):
+    """A counter or gauge whose samples are read from a function at scrape time.
+
+    Used for values other objects already track (queue depths, hedge
+    counts), so the hot path does no extra work for them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        function: Callable[[], dict[tuple[str, ...], float]],
+        labelnames: tuple[str, ...] = (),
+    ):
+        super().__init__(name, help, labelnames)
+        self.kind = kind
+        self.function = function
+
+    def _samples(self):
+        suffix = "_total" if self.kind == "counter" else ""
+        try:
+            values = self.function()
+        except Exception:
+            return []
+        return [(suffix, self._label_pairs(v), value) for v, value in values.items()]
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them for Prometheus."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def _add(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(f"Metric {metric.name} already registered as {existing.kind}")
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Create or return a counter (``_total`` is appended on export)."""
+        return self._add(Counter(name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Create or return a gauge."""
+        return self._add(Gauge(name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Create or return a histogram."""
+        return self._add(Histogram(name, help, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        help: str,
+        kind: str,
+        function: Callable[[], dict[tuple[str, ...], float]],
+        labelnames: tuple[str, ...] = (),
+    ) -> CallbackMetric:
+        """Register a counter or gauge read from ``function`` at scrape time.
+
+        ``function`` returns a mapping of label value tuples to values.
+        Registering the same name again replaces the function.
+        """
+        metric = CallbackMetric(name, help, kind, function, labelnames)
+        with self._lock:
+            self._metrics[name] = metric
+        return metric
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            # Text format 0.0.4 names counter families by their _total samples
+            family = f"{metric.name}_total" if metric.kind == "counter" else metric.name
+            lines.append(f"# HELP {family} {_escape_help(metric.help)}")
+            lines.append(f"# TYPE {family} {metric.kind}")
+            for suffix, pairs, value in metric._samples():
+                if pairs:
+                    label_text = ",".join(f'{key}="{_escape_label(str(v))}"' for key, v in pairs)
+                    lines.append(f"{metric.name}{suffix}{{{label_text}}} {_format_value(value)}")
+                else:
+                    lines.append(f"{metric.name}{suffix} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str):
+        """Write the current metrics to a file atomically (node_exporter textfile style)."""
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            f.write(self.render())
+        os.replace(tmp, path)
+
+    def serve(self, port: int = 9464, host: str = "127.0.0.1") -> int:
+        """Serve ``/metrics`` over HTTP from a daemon thread.
+
+        Returns:
+            The port being served (useful with port 0)
+        """
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(
+            target=self._server.serve_forever, name="metrics-http", daemon=True
+        ).start()
+        return self._server.server_address[1]
+
+    def stop(self):
+        """Stop the HTTP endpoint, if running."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class MeetingMetrics:
+    """The metrics recorded by agents, meetings and the voice engine.
+
+    Pass one instance to every ``TeamMeeting`` in a worker; it is shared
+    across threads. Recording a call is a few dict lookups and additions.
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """Initialize the metric families.
+
+        Args:
+            registry: Registry to add the metrics to (defaults to a new one)
+        """
+        self.registry = registry or MetricsRegistry()
+        r = self.registry
+        self.llm_latency = r.histogram(
+            "meeting_llm_call_seconds", "LLM call latency by agent and phase.", ("agent", "phase")
+        )
+        self.llm_tokens = r.counter(
+            "meeting_llm_tokens", "LLM tokens by agent, phase and direction.", ("agent", "phase", "direction")
+        )
+        self.llm_errors = r.counter(
+            "meeting_llm_errors", "LLM calls that raised, by agent and phase.", ("agent", "phase")
+        )
+        # The OpenAI client's own 429/5xx retries happen inside a call and are
+        # not visible here; they show up as latency
+        self.llm_fallbacks = r.counter(
+            "meeting_llm_fallbacks",
+            "LLM calls redirected or redone by a fallback, by reason.",
+            ("reason",),
+        )
+        self.tts_seconds = r.histogram(
+            "meeting_tts_synthesis_seconds",
+            "Text-to-speech synthesis time by agent.",
+            ("agent",),
+            buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0),
+        )
+        self.meetings_in_flight = r.gauge("meeting_in_flight", "Meetings currently running.")
+        self.meetings_in_flight.set(0)
+        self.meetings = r.counter("meeting_runs", "Finished meetings by outcome.", ("outcome",))
+        self._voice_engines = weakref.WeakSet()
+        self._hedge_policies = weakref.WeakSet()
+
+    def record_call(
+        self,
+        agent: str,
+        phase: str,
+        latency: float,
+        input_tokens: int,
+        output_tokens: int,
+        fell_back: bool = False,
+    ):
+        """Record one finished LLM call."""
+        self.llm_latency.labels(agent, phase).observe(latency)
+        self.llm_tokens.labels(agent, phase, "input").inc(input_tokens)
+        self.llm_tokens.labels(agent, phase, "output").inc(output_tokens)
+        if fell_back:
+            self.llm_fallbacks.labels("route").inc()
+
+    def record_error(self, agent: str, phase: str):
+        """Record an LLM call that raised."""
+        self.llm_errors.labels(agent, phase).inc()
+
+    def record_fallback(self, reason: str):
+        """Record a call redirected or redone by a fallback, such as ``panel``."""
+        self.llm_fallbacks.labels(reason).inc()
+
+    def record_tts(self, agent: str, seconds: float):
+        """Record the time spent synthesizing one utterance or sentence."""
+        self.tts_seconds.labels(agent).observe(seconds)
+
+    def meeting_started(self):
+        """Count a meeting as in flight."""
+        self.meetings_in_flight.inc()
+
+    def meeting_finished(self, outcome: str = "completed"):
+        """Move a meeting from in flight to finished with ``outcome``."""
+        self.meetings_in_flight.dec()
+        self.meetings.labels(outcome).inc()
+
+    def watch_voice_engine(self, voice_engine):
+        """Export the sentences waiting in a voice engine's streaming queue.
+
+        Every watched engine is summed; the metric is registered once.
+        """
+        first = not self._voice_engines
+        self._voice_engines.add(voice_engine)
+        if not first:
+            return
+        self.registry.callback(
+            "meeting_tts_queue_depth",
+            "Sentences waiting for speech synthesis.",
+            "gauge",
+            lambda: {(): sum(engine.queue_depth for engine in list(self._voice_engines))},
+        )
+
+    def watch_hedging(self, hedge_policy):
+        """Export hedged (duplicated) requests, summed over every watched HedgePolicy.
+
+        The metric is registered once; later policies are added to the sum.
+        """
+        first = not self._hedge_policies
+        self._hedge_policies.add(hedge_policy)
+        if not first:
+            return
+
+        def hedges():
+            policies = list(self._hedge_policies)
+            return {
+                ("sent",): sum(p.stats.hedges for p in policies),
+                ("won",): sum(p.stats.hedge_wins for p in policies),
+                ("denied",): sum(p.stats.budget_denied for p in policies),
+            }
+
+        self.registry.callback(
+            "meeting_llm_hedges",
+            "Duplicate requests sent by request hedging, by result.",
+            "counter",
+            hedges,
+            ("result",),
+        )
+
+    def watch_scenario_cache(self, cache_stats: dict[str, int]):
+        """Export compiled scenario cache lookups (``scenario.cache_stats``)."""
+        self.registry.callback(
+            "meeting_scenario_cache_lookups",
+            "Compiled scenario lookups by result.",
+            "counter",
+            lambda: {(result,): count for result, count in list(cache_stats.items())},
+            ("result",),
+        )
+
+    def watch_batch_runner(self, runner):
+        """Export a BatchMeetingRunner's retried requests and failed meetings."""
+        self.registry.callback(
+            "meeting_batch_retries",
+            "Batch requests that failed and were queued for another round.",
+            "counter",
+            lambda: {(): sum(runner.attempts.values())},
+        )
+        self.registry.callback(
+            "meeting_batch_failed_meetings",
+            "Batch meetings abandoned after max_attempts.",
+            "gauge",
+            lambda: {(): len(runner.failed)},
+        )
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _escape_label(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
@@ -0,0 +1,238 @@
+"""Local OpenAI-compatible mock server for load testing without API credits."""
+
+import argparse
+import json
+import random
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+REPLY_WORDS = (
+    "From my perspective we should prioritize measurable outcomes, align the "
+    "budget with our roadmap, and review progress with the team every quarter"
+).split()
+
+
+@dataclass
+class MockConfig:
+    """Behaviour of the mock server.
+
+    Attributes:
+        latency: Median response latency in seconds
+        jitter: Log-normal sigma applied to the latency (0 for constant)
+        error_rate: Fraction of requests answered with HTTP 500
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+        reply_words: Number of words in each completion
+        seed: Random seed for reproducible runs
+    """
+
+    latency: float = 0.5
+    jitter: float = 0.3
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    reply_words: int = 40
+    seed: int = 0
+
+
+class MockOpenAIServer(ThreadingHTTPServer):
+    """Threaded HTTP server speaking the chat completions API."""
+
+    daemon_threads = True
+
+    def __init__(self, config: MockConfig, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.counts = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0}
+        self.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockOpenAIServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+    def draw(self) -> tuple[str, float]:
+        """Pick the outcome and latency of the next request."""
+        with self.lock:
+            self.counts["requests"] += 1
+            roll = self.random.random()
+            delay = self.config.latency * self.random.lognormvariate(0, self.config.jitter)
+            if roll < self.config.rate_limit_rate:
+                outcome = "rate_limited"
+            elif roll < self.config.rate_limit_rate + self.config.error_rate:
+                outcome = "errors"
+            else:
+                outcome = "ok"
+            self.counts[outcome] += 1
+        return outcome, delay
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: MockOpenAIServer
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: dict = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") == "/stats":
+            with self.server.lock:
+                self._send_json(200, dict(self.server.counts))
+        elif self.path.rstrip("/") == "/v1/models":
+            self._send_json(200, {"object": "list", "data": []})
+        else:
+            self._send_json(404, {"error": {"message": "Not found"}})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self._send_json(404, {"error": {"message": "Not found"}})
+            return
+
+        outcome, delay = self.server.draw()
+        streaming = bool(request.get("stream")) and outcome == "ok"
+        # Streamed replies spend part of the latency before the first token
+        time.sleep(delay * 0.3 if streaming else delay)
+        if outcome == "rate_limited":
+            self._send_json(
+                429,
+                {"error": {"message": "Rate limit reached", "type": "rate_limit_exceeded"}},
+                {"Retry-After": "0"},
+            )
+            return
+        if outcome == "errors":
+            self._send_json(500, {"error": {"message": "Mock server error", "type": "server_error"}})
+            return
+
+        rng = random.Random(delay)
+        words = [rng.choice(REPLY_WORDS) for _ in range(self.server.config.reply_words)]
+        text = " ".join(words).capitalize() + "."
+        model = request.get("model", "gpt-4o-mini")
+        prompt_chars = sum(len(str(m.get("content", ""))) for m in request.get("messages", []))
+        usage = {
+            "prompt_tokens": prompt_chars // 4,
+            "completion_tokens": len(words),
+            "total_tokens": prompt_chars // 4 + len(words),
+        }
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+
+        if streaming:
+            include_usage = bool((request.get("stream_options") or {}).get("include_usage"))
+            self._stream(
+                completion_id, model, words, delay * 0.7, usage if include_usage else None
+            )
+            return
+
+        self._send_json(
+            200,
+            {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": usage,
+            },
+        )
+
+    def _stream(
+        self,
+        completion_id: str,
+        model: str,
+        words: list[str],
+        duration: float,
+        usage: Optional[dict] = None,
+    ):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+        for index, word in enumerate(words):
+            time.sleep(duration / len(words))
+            token = word.capitalize() if index == 0 else f" {word}"
+            if index == len(words) - 1:
+                token += "."
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": None}],
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+        if usage is not None:
+            # Sent last with no choices, as the API does for stream_options.include_usage
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [],
+                "usage": usage,
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        self.wfile.write(b"data: [DONE]\n\n")
+
+
+def serve(config: MockConfig, host: str = "127.0.0.1", port: int = 8000):
+    """Run the mock server in the foreground."""
+    server = MockOpenAIServer(config, host, port)
+    print(f"Mock OpenAI server listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    """Start a standalone mock server."""
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible mock server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--jitter", type=float, default=0.3)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    config = MockConfig(args.latency, args.jitter, args.error_rate, args.rate_limit_rate)
+    serve(config, args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
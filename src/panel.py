@@ -0,0 +1,214 @@
+"""Single-call generation of several colleagues' replies to one statement."""
+
+import re
+from dataclasses import dataclass
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from pydantic import BaseModel, Field, ValidationError
+
+from agents import CorporateAgent, render_system_prompt
+from routing import estimate_tokens
+
+PANEL_SYSTEM_PROMPT = """You write the replies of several participants in a corporate strategy meeting at {company}.
+Each participant replies in their own voice, from their own expertise and priorities, in 2-3 sentences.
+Participants may disagree with the speaker and with each other. Use real business terminology relevant to each role.
+
+Participants:
+{personas}
+
+Return only a JSON object of the form {{"replies": [{{"agent": "<id>", "reply": "<text>"}}]}} with exactly one reply per participant, in the order listed."""
+
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*|\s*```$")
+
+
+class PanelReply(BaseModel):
+    """One participant's reply in a panel response."""
+
+    agent: str
+    reply: str = Field(min_length=1)
+
+
+class PanelReplies(BaseModel):
+    """The JSON object a panel call must return."""
+
+    replies: list[PanelReply]
+
+
+@dataclass
+class PanelStats:
+    """Round trips and prompt tokens of panel fan-outs versus per-agent calls.
+
+    ``round_trips`` and ``prompt_tokens`` cover panel calls that produced
+    replies, and the ``baseline_*`` fields the per-agent calls those replies
+    replaced. Replies generated per agent after a fallback cost the same
+    either way and are left out of both; the panel calls that produced
+    nothing usable are the fallback overhead.
+    """
+
+    panels: int = 0
+    replies: int = 0
+    fallbacks: int = 0
+    round_trips: int = 0
+    prompt_tokens: int = 0
+    baseline_round_trips: int = 0
+    baseline_prompt_tokens: int = 0
+    overhead_round_trips: int = 0
+    overhead_prompt_tokens: int = 0
+
+
+class PanelResponder:
+    """Generates all respondents' replies to a statement in one JSON-mode call.
+
+    The shared statement and topic are sent once instead of once per
+    respondent. Replies that are missing or fail validation are generated
+    with the usual per-agent ``respond_to_colleague`` calls.
+    """
+
+    def __init__(self):
+        self.stats = PanelStats()
+        self.metrics = None
+        # Set by TeamMeeting from its own verbosity
+        self.verbose = True
+
+    def build_messages(
+        self,
+        respondents: dict[str, CorporateAgent],
+        colleague_name: str,
+        colleague_statement: str,
+        topic: str,
+    ) -> list[BaseMessage]:
+        """Build the prompt asking for every respondent's reply.
+
+        Respondents are described by their persona fields. One whose system
+        prompt differs from the one those fields render (a custom prompt)
+        is described by that prompt instead.
+        """
+        personas = "\n".join(
+            _describe(key, agent) for key, agent in respondents.items()
+        )
+        company = next(iter(respondents.values())).company
+        prompt = f"""Your colleague {colleague_name} just said:
+"{colleague_statement}"
+
+You're discussing: {topic}
+
+Write each participant's thoughtful response that either builds on the idea, offers an alternative perspective,
+or raises important considerations from their area of expertise. Participant ids: {", ".join(respondents)}."""
+        return [
+            SystemMessage(
+                content=PANEL_SYSTEM_PROMPT.format(company=company, personas=personas)
+            ),
+            HumanMessage(content=prompt),
+        ]
+
+    def respond(
+        self,
+        respondents: dict[str, CorporateAgent],
+        colleague_name: str,
+        colleague_statement: str,
+        topic: str,
+    ) -> dict[str, str]:
+        """Return each respondent's reply keyed by agent id, in respondent order.
+
+        The first respondent's model, routing and hedging make the panel
+        call. Each respondent's ``last_call`` gets an equal share of its
+        latency and tokens so transcripts stay comparable.
+        """
+        caller = next(iter(respondents.values()))
+        messages = self.build_messages(
+            respondents, colleague_name, colleague_statement, topic
+        )
+        panel_tokens = estimate_tokens(messages)
+        self.stats.panels += 1
+
+        # Request errors (auth, HTTP) propagate; only an unusable reply falls back
+        text = caller.complete(messages, "response_panel", json_mode=True)
+        try:
+            parsed = parse_panel_replies(text, list(respondents))
+        except ValueError as e:
+            if self.verbose:
+                print(f"Warning: Panel reply failed, falling back to per-agent calls: {e}")
+            parsed = {}
+
+        if parsed:
+            self.stats.round_trips += 1
+            self.stats.prompt_tokens += panel_tokens
+            for key in parsed:
+                self.stats.baseline_round_trips += 1
+                self.stats.baseline_prompt_tokens += estimate_tokens(
+                    respondents[key].build_response_messages(
+                        colleague_name, colleague_statement, topic
+                    )
+                )
+        else:
+            self.stats.overhead_round_trips += 1
+            self.stats.overhead_prompt_tokens += panel_tokens
+
+        if parsed and caller.last_call is not None:
+            share = caller.last_call
+            n = len(parsed)
+            for key in parsed:
+                respondents[key].last_call = share._replace(
+                    latency=share.latency / n,
+                    input_tokens=share.input_tokens // n,
+                    output_tokens=share.output_tokens // n,
+                )
+
+        replies = {}
+        for key, agent in respondents.items():
+            if key in parsed:
+                replies[key] = parsed[key]
+                self.stats.replies += 1
+                continue
+            replies[key] = agent.respond_to_colleague(
+                colleague_name, colleague_statement, topic
+            )
+            self.stats.fallbacks += 1
+            if self.metrics is not None:
+                self.metrics.record_fallback("panel")
+        return replies
+
+    def report(self) -> str:
+        """Summarize round trips and prompt tokens against per-agent calls.
+
+        Savings cover replies the panel produced; failed panel calls are
+        reported separately as fallback overhead.
+        """
+        s = self.stats
+        return (
+            f"panels={s.panels} replies={s.replies} fallbacks={s.fallbacks} "
+            f"round_trips={s.round_trips} (per-agent: {s.baseline_round_trips}) "
+            f"est_prompt_tokens={s.prompt_tokens} (per-agent: {s.baseline_prompt_tokens}) "
+            f"fallback_overhead: round_trips={s.overhead_round_trips} "
+            f"est_prompt_tokens={s.overhead_prompt_tokens}"
+        )
+
+
+def _describe(key: str, agent: CorporateAgent) -> str:
+    rendered = render_system_prompt(
+        agent.name, agent.role, agent.expertise, agent.personality, agent.company
+    )
+    if agent.system_prompt is not None and agent.system_prompt != rendered:
+        prompt = agent.system_prompt.replace("\n", "\n  ")
+        return f"- id: {key} | {agent.name}, {agent.role}. Persona:\n  {prompt}"
+    return (
+        f"- id: {key} | {agent.name}, {agent.role}. "
+        f"Expertise: {', '.join(agent.expertise)}. Personality: {agent.personality}"
+    )
+
+
+def parse_panel_replies(text: str, keys: list[str]) -> dict[str, str]:
+    """Validate a panel response and return the replies for the expected agents.
+
+    Raises:
+        ValueError: If the text is not a valid panel response
+    """
+    try:
+        panel = PanelReplies.model_validate_json(_CODE_FENCE.sub("", text.strip()))
+    except ValidationError as e:
+        raise ValueError(f"invalid panel response: {e.error_count()} errors") from e
+    replies: dict[str, str] = {}
+    for item in panel.replies:
+        if item.agent in keys and item.agent not in replies:
+            replies[item.agent] = item.reply.strip()
+    return replies
@@ -0,0 +1,151 @@
+"""Local relevance scoring of team members against a discussion topic."""
+
+import math
+import re
+from typing import Iterable
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_SUFFIXES = (
+    "ional", "ments", "ment", "ings", "ing", "ions", "ion", "ical", "ives", "ive",
+    "ies", "ial", "ors", "ers", "ic", "al", "ed", "es", "or", "er", "s", "y", "e",
+)
+
+STOPWORDS = frozenset(
+    """a an and are as at be between by can do does for from how in into is it its
+    key next of on or our should that the their this to vs we what when which while
+    who will with would year years month months primary heavily best most more new
+    chief officer vp vice president head director senior executive""".split()
+)
+
+# Topic words that point at an area of expertise without naming it
+RELATED_TERMS = {
+    "ai": ("ml", "innovation", "technology", "data"),
+    "ml": ("ai", "innovation", "technology", "data"),
+    "research": ("innovation", "technology"),
+    "invest": ("financial", "budget", "capital"),
+    "shareholder": ("financial", "investor", "stakeholder"),
+    "return": ("financial", "investor"),
+    "revenue": ("financial", "sales", "growth"),
+    "cost": ("financial", "budget", "efficiency"),
+    "pric": ("market", "revenue"),
+    "talent": ("team", "hiring", "culture", "staff"),
+    "hir": ("talent", "team", "staff"),
+    "culture": ("team", "talent"),
+    "customer": ("market", "brand", "client"),
+    "competit": ("market", "strategic", "position"),
+    "expansion": ("market", "growth", "strategic"),
+    "growth": ("market", "strategic"),
+    "complexity": ("operations", "process"),
+    "scal": ("operations", "infrastructure", "process"),
+    "cloud": ("infrastructure", "technology"),
+    "security": ("risk", "infrastructure"),
+    "compliance": ("regulatory", "risk"),
+    "regulat": ("compliance", "risk"),
+    "brand": ("marketing", "position"),
+    "digital": ("technology", "transformation"),
+    "partner": ("strategic", "stakeholder"),
+}
+
+
+def stem(word: str) -> str:
+    """Strip up to two common English suffixes, keeping at least three letters."""
+    for _ in range(2):
+        for suffix in _SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                word = word[: -len(suffix)]
+                break
+        else:
+            break
+    return word
+
+
+def terms(text: str) -> list[str]:
+    """Stemmed content words of a text, in order."""
+    text = text.lower().replace("r&d", "research development")
+    return [stem(token) for token in _TOKEN.findall(text) if token not in STOPWORDS]
+
+
+_RELATED = {stem(word): tuple(stem(r) for r in related) for word, related in RELATED_TERMS.items()}
+
+
+class RelevanceIndex:
+    """Term index over a team's expertise and roles for ranking respondents.
+
+    Built once per team. Each agent's expertise and role terms are weighted
+    by inverse document frequency across the team, so terms every member
+    shares count for little and a term only one member has counts most.
+    """
+
+    def __init__(
+        self,
+        agents: dict,
+        expertise_weight: float = 1.0,
+        role_weight: float = 1.0,
+        related_weight: float = 0.5,
+    ):
+        """Build the index.
+
+        Args:
+            agents: Team keyed by agent id
+            expertise_weight: Weight of a match on an expertise term
+            role_weight: Weight of a match on a role term
+            related_weight: Weight of a match through RELATED_TERMS
+        """
+        self.keys = list(agents)
+        self.related_weight = related_weight
+        self._weights: dict[str, dict[str, float]] = {}
+        document_frequency: dict[str, int] = {}
+        for key, agent in agents.items():
+            weights: dict[str, float] = {}
+            for term in terms(" ".join(agent.expertise)):
+                weights[term] = max(weights.get(term, 0.0), expertise_weight)
+            for term in terms(agent.role):
+                weights[term] = max(weights.get(term, 0.0), role_weight)
+            self._weights[key] = weights
+            for term in weights:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        n = len(self.keys)
+        self._idf = {
+            term: math.log((n + 1) / (df + 0.5)) for term, df in document_frequency.items()
+        }
+
+    def scores(self, topic: str) -> dict[str, float]:
+        """Relevance of every agent to a topic, keyed by agent id."""
+        topic_terms = set(terms(topic))
+        related: set[str] = set()
+        for term in topic_terms:
+            related.update(_RELATED.get(term, ()))
+        related -= topic_terms
+
+        scores = {}
+        for key in self.keys:
+            weights = self._weights[key]
+            score = 0.0
+            for term in topic_terms:
+                if term in weights:
+                    score += weights[term] * self._idf[term]
+            for term in related:
+                if term in weights:
+                    score += self.related_weight * weights[term] * self._idf[term]
+            scores[key] = score
+        return scores
+
+    def rank(
+        self,
+        topic: str,
+        k: int,
+        exclude: Iterable[str] = (),
+        threshold: float = 0.0,
+    ) -> list[str]:
+        """The ``k`` most relevant agents, most relevant first.
+
+        Ties keep team order. With a positive ``threshold``, agents scoring
+        below it are left out even if fewer than ``k`` remain.
+        """
+        excluded = set(exclude)
+        scores = self.scores(topic)
+        candidates = [key for key in self.keys if key not in excluded]
+        if threshold > 0:
+            candidates = [key for key in candidates if scores[key] >= threshold]
+        candidates.sort(key=lambda key: -scores[key])
+        return candidates[:k]
@@ -0,0 +1,273 @@
+"""Tiered model routing for agent turns."""
+
+import threading
+from collections import defaultdict, deque
+from dataclasses import dataclass, field
+from typing import Optional
+
+from langchain_openai import ChatOpenAI
+
+
+@dataclass(frozen=True)
+class ModelTier:
+    """A model configuration that turns can be routed to.
+
+    Attributes:
+        name: Tier name used by routing rules (e.g. "fast", "strong")
+        model: OpenAI model name
+        temperature: Sampling temperature for this tier
+        input_cost_per_1k: USD per 1K prompt tokens
+        output_cost_per_1k: USD per 1K completion tokens
+        max_p95: Latency budget in seconds; when the observed p95 of this
+            model exceeds it, turns fall back to the next faster tier
+    """
+
+    name: str
+    model: str
+    temperature: float = 0.7
+    input_cost_per_1k: float = 0.0
+    output_cost_per_1k: float = 0.0
+    max_p95: Optional[float] = None
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        """Estimate the USD cost of a call on this tier."""
+        return (
+            input_tokens * self.input_cost_per_1k
+            + output_tokens * self.output_cost_per_1k
+        ) / 1000
+
+
+@dataclass(frozen=True)
+class RouteRule:
+    """Maps turns matching an agent, phase and prompt size to a tier.
+
+    Fields left as None match anything. Rules are checked in order and the
+    first match wins.
+    """
+
+    tier: str
+    agent: Optional[str] = None
+    phase: Optional[str] = None
+    min_prompt_tokens: int = 0
+    max_prompt_tokens: Optional[int] = None
+
+    def matches(self, agent: str, phase: str, prompt_tokens: int) -> bool:
+        """Check whether a turn falls under this rule."""
+        if self.agent is not None and self.agent != agent:
+            return False
+        if self.phase is not None and self.phase != phase:
+            return False
+        if prompt_tokens < self.min_prompt_tokens:
+            return False
+        if self.max_prompt_tokens is not None and prompt_tokens > self.max_prompt_tokens:
+            return False
+        return True
+
+
+def percentile(samples, q: float) -> Optional[float]:
+    """Nearest-rank percentile of a sequence of numbers (q in [0, 1])."""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(q * len(ordered))) - 1))
+    return ordered[index]
+
+
+class LatencyTracker:
+    """Rolling window of observed call latencies keyed by model."""
+
+    def __init__(self, window: int = 200):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of most recent samples kept per key
+        """
+        self.window = window
+        self._samples: dict[str, deque] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float):
+        """Record one latency sample."""
+        with self._lock:
+            self._samples[key].append(seconds)
+
+    def count(self, key: str) -> int:
+        """Number of samples currently held for a key."""
+        with self._lock:
+            return len(self._samples.get(key, ()))
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """Latency percentile for a key, or None without samples."""
+        with self._lock:
+            samples = list(self._samples.get(key, ()))
+        return percentile(samples, q)
+
+
+@dataclass
+class RouteStats:
+    """Latency and cost accumulated for one (agent, phase, model) route."""
+
+    calls: int = 0
+    fallbacks: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    latencies: deque = field(default_factory=lambda: deque(maxlen=500))
+
+    @property
+    def mean_latency(self) -> float:
+        return sum(self.latencies) / len(self.latencies) if self.latencies else 0.0
+
+    @property
+    def p95_latency(self) -> float:
+        return percentile(self.latencies, 0.95) or 0.0
+
+
+class RoutingPolicy:
+    """Picks a model tier per (agent, phase, prompt size) turn.
+
+    Tiers are listed from most capable to fastest. When the preferred tier's
+    observed p95 latency exceeds its ``max_p95``, the turn moves down the list
+    to the next faster tier. Every ``probe_every``-th such turn still goes to
+    the preferred tier so that its latency estimate keeps updating.
+    """
+
+    def __init__(
+        self,
+        tiers: list[ModelTier],
+        default_tier: str,
+        rules: Optional[list[RouteRule]] = None,
+        min_samples: int = 5,
+        probe_every: int = 20,
+    ):
+        """Initialize the routing policy.
+
+        Args:
+            tiers: Available tiers, ordered from most capable to fastest
+            default_tier: Tier used when no rule matches
+            rules: Ordered routing rules
+            min_samples: Samples required before latency fallback kicks in
+            probe_every: Send every Nth fallback-eligible turn to the preferred tier
+        """
+        self.tiers = list(tiers)
+        self._tier_index = {tier.name: i for i, tier in enumerate(self.tiers)}
+        if default_tier not in self._tier_index:
+            raise ValueError(f"Unknown default tier: {default_tier}")
+        for rule in rules or []:
+            if rule.tier not in self._tier_index:
+                raise ValueError(f"Unknown tier in routing rule: {rule.tier}")
+
+        self.default_tier = default_tier
+        self.rules = list(rules or [])
+        self.min_samples = min_samples
+        self.probe_every = probe_every
+        self.latency = LatencyTracker()
+
+        self._llms: dict[str, ChatOpenAI] = {}
+        self._stats: dict[tuple[str, str, str], RouteStats] = defaultdict(RouteStats)
+        self._skipped: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def default(cls, latency_budget: float = 8.0) -> "RoutingPolicy":
+        """A three-tier policy: fast reactions, standard turns, strong closing."""
+        tiers = [
+            ModelTier("strong", "gpt-4o", 0.7, 0.0025, 0.01, max_p95=latency_budget),
+            ModelTier(
+                "standard", "gpt-4o-mini", 0.7, 0.00015, 0.0006, max_p95=latency_budget
+            ),
+            ModelTier("fast", "gpt-4.1-nano", 0.7, 0.0001, 0.0004),
+        ]
+        rules = [
+            RouteRule("strong", phase="closing"),
+            RouteRule("fast", phase="response", max_prompt_tokens=600),
+        ]
+        return cls(tiers, default_tier="standard", rules=rules)
+
+    def select(self, agent: str, phase: str, prompt_tokens: int) -> tuple[ModelTier, bool]:
+        """Choose a tier for a turn.
+
+        Returns:
+            The selected tier and whether it is a latency fallback
+        """
+        preferred = self.default_tier
+        for rule in self.rules:
+            if rule.matches(agent, phase, prompt_tokens):
+                preferred = rule.tier
+                break
+
+        index = self._tier_index[preferred]
+        while index < len(self.tiers) - 1 and self._over_budget(self.tiers[index]):
+            index += 1
+
+        if index != self._tier_index[preferred]:
+            with self._lock:
+                self._skipped[preferred] += 1
+                probe = self._skipped[preferred] % self.probe_every == 0
+            if probe:
+                return self.tiers[self._tier_index[preferred]], False
+        return self.tiers[index], index != self._tier_index[preferred]
+
+    def route(self, agent: str, phase: str, messages) -> tuple[ModelTier, bool]:
+        """Choose a tier for a turn from its prompt messages."""
+        return self.select(agent, phase, estimate_tokens(messages))
+
+    def _over_budget(self, tier: ModelTier) -> bool:
+        if tier.max_p95 is None or self.latency.count(tier.model) < self.min_samples:
+            return False
+        p95 = self.latency.percentile(tier.model, 0.95)
+        return p95 is not None and p95 > tier.max_p95
+
+    def get_llm(self, tier: ModelTier) -> ChatOpenAI:
+        """Return the shared client for a tier, creating it on first use."""
+        with self._lock:
+            llm = self._llms.get(tier.name)
+            if llm is None:
+                llm = ChatOpenAI(model=tier.model, temperature=tier.temperature)
+                self._llms[tier.name] = llm
+            return llm
+
+    def record(
+        self,
+        agent: str,
+        phase: str,
+        tier: ModelTier,
+        latency: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        fell_back: bool = False,
+    ):
+        """Record the outcome of a routed call."""
+        self.latency.record(tier.model, latency)
+        with self._lock:
+            stats = self._stats[(agent, phase, tier.model)]
+            stats.calls += 1
+            stats.fallbacks += int(fell_back)
+            stats.input_tokens += input_tokens
+            stats.output_tokens += output_tokens
+            stats.cost += tier.cost(input_tokens, output_tokens)
+            stats.latencies.append(latency)
+
+    def stats(self) -> dict[tuple[str, str, str], RouteStats]:
+        """Per-route statistics keyed by (agent, phase, model)."""
+        with self._lock:
+            return dict(self._stats)
+
+    def report(self) -> str:
+        """Format per-route latency and cost as a table."""
+        lines = [
+            f"{'agent':<12} {'phase':<14} {'model':<14} {'calls':>5} "
+            f"{'fallback':>8} {'mean s':>7} {'p95 s':>7} {'cost $':>9}"
+        ]
+        for (agent, phase, model), stats in sorted(self.stats().items()):
+            lines.append(
+                f"{agent:<12} {phase:<14} {model:<14} {stats.calls:>5} "
+                f"{stats.fallbacks:>8} {stats.mean_latency:>7.2f} "
+                f"{stats.p95_latency:>7.2f} {stats.cost:>9.5f}"
+            )
+        return "\n".join(lines)
+
+
+def estimate_tokens(messages) -> int:
+    """Rough prompt size in tokens (about four characters per token)."""
+    return sum(len(str(message.content)) // 4 + 4 for message in messages)
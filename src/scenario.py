@@ -0,0 +1,300 @@
+"""Declarative team and agenda definitions with a precompiled cache.
+
+A scenario file (TOML or JSON) describes a team and an agenda:
+
+    company = "Meridian Consulting"
+    chair = "managing_partner"
+
+    [[team]]
+    key = "managing_partner"
+    name = "Alexandra Sterling"
+    role = "Managing Partner"
+    expertise = ["Client Relations", "Business Strategy"]
+    personality = "Driven, client-focused, and results-oriented."
+    voice = { voice_index = 0, rate = 180 }
+
+    [agenda]
+    title = "PARTNER STRATEGY OFFSITE"
+
+    [[agenda.items]]
+    kind = "discussion"
+    topic = "Which practice areas should we grow next year?"
+    primary_speaker = "managing_partner"
+
+The file is validated once and compiled into a CompiledScenario with the
+system prompts rendered and voice profiles resolved. Compiled scenarios are
+cached as JSON in the user cache directory by file hash, and in memory per
+process, so workers starting many meetings from the same file skip parsing,
+validation and rendering.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tomllib
+from collections import Counter
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Literal, Optional
+
+from langchain_openai import ChatOpenAI
+from pydantic import BaseModel, Field, ValidationError, model_validator
+
+from agenda import Agenda, Debate, Discussion, RoundTable
+from agents import CorporateAgent, render_system_prompt
+from tts import AgentVoice
+
+# Bump when the compiled format or prompt rendering changes
+COMPILER_VERSION = 3
+
+
+def _user_cache_dir() -> Path:
+    if os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME")
+    return Path(base or Path.home() / ".cache") / "agentic-team-chat" / "scenarios"
+
+
+DEFAULT_CACHE_DIR = _user_cache_dir()
+
+
+class VoiceSpec(BaseModel):
+    """Voice profile of an agent."""
+
+    voice_index: int = Field(0, ge=0)
+    rate: int = Field(175, ge=50, le=400)
+    volume: float = Field(1.0, ge=0.0, le=1.0)
+
+
+class AgentSpec(BaseModel):
+    """Persona of one team member."""
+
+    key: str = Field(min_length=1)
+    name: str
+    role: str
+    expertise: list[str] = Field(min_length=1)
+    personality: str
+    voice: Optional[VoiceSpec] = None
+
+
+class AgendaItemSpec(BaseModel):
+    """One agenda item; which fields are required depends on its kind."""
+
+    kind: Literal["discussion", "debate", "round_table"]
+    topic: str = Field(min_length=1)
+    primary_speaker: Optional[str] = None
+    num_responses: int = Field(3, ge=0)
+    side1: Optional[str] = None
+    side2: Optional[str] = None
+    max_turns: int = Field(3, ge=1)
+
+    @model_validator(mode="after")
+    def _check_speakers(self):
+        if self.kind == "debate" and not (self.side1 and self.side2):
+            raise ValueError("debate items need side1 and side2")
+        return self
+
+
+class AgendaSpec(BaseModel):
+    """Meeting title and agenda items."""
+
+    title: str
+    items: list[AgendaItemSpec] = Field(min_length=1)
+
+
+class ScenarioSpec(BaseModel):
+    """A complete scenario file: company, team, chair and agenda."""
+
+    company: str = "TechVenture Corp"
+    chair: Optional[str] = None
+    team: list[AgentSpec] = Field(min_length=1)
+    agenda: AgendaSpec
+
+    @model_validator(mode="after")
+    def _check_references(self):
+        keys = [agent.key for agent in self.team]
+        if len(set(keys)) != len(keys):
+            raise ValueError("team member keys must be unique")
+        if self.chair is None:
+            self.chair = "ceo" if "ceo" in keys else keys[0]
+        if self.chair not in keys:
+            raise ValueError(f"chair '{self.chair}' is not a team member")
+        for item in self.agenda.items:
+            for speaker in (item.primary_speaker, item.side1, item.side2):
+                if speaker is not None and speaker not in keys:
+                    raise ValueError(f"agenda speaker '{speaker}' is not a team member")
+        return self
+
+
+@dataclass(frozen=True)
+class CompiledAgent:
+    """A team member ready to instantiate, with its system prompt rendered."""
+
+    key: str
+    name: str
+    role: str
+    expertise: tuple[str, ...]
+    personality: str
+    system_prompt: str
+    voice: Optional[dict]
+
+
+@dataclass(frozen=True)
+class CompiledScenario:
+    """Validated, pre-rendered form of a scenario file."""
+
+    source: str
+    digest: str
+    company: str
+    chair: str
+    agents: tuple[CompiledAgent, ...]
+    agenda: Agenda
+
+    def to_dict(self) -> dict:
+        """Convert to plain JSON-serializable data for the disk cache."""
+        data = asdict(self)
+        data["agenda"] = self.agenda.to_dict()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CompiledScenario":
+        """Build a compiled scenario from the output of ``to_dict``."""
+        agents = tuple(
+            CompiledAgent(**{**agent, "expertise": tuple(agent["expertise"])})
+            for agent in data["agents"]
+        )
+        return cls(**{**data, "agents": agents, "agenda": Agenda.from_dict(data["agenda"])})
+
+    def build_team(self, llm=None) -> dict[str, CorporateAgent]:
+        """Instantiate the team keyed by agent id.
+
+        Args:
+            llm: Chat model shared by every agent (defaults to one client
+                shared across the process)
+        """
+        if llm is None:
+            llm = _shared_llm()
+        team = {}
+        for agent in self.agents:
+            team[agent.key] = CorporateAgent(
+                name=agent.name,
+                role=agent.role,
+                expertise=list(agent.expertise),
+                personality=agent.personality,
+                company=self.company,
+                system_prompt=agent.system_prompt,
+                llm=llm,
+            )
+        return team
+
+    def apply_voices(self, voice_engine: AgentVoice):
+        """Register the scenario's voice profiles with a voice engine."""
+        for agent in self.agents:
+            if agent.voice is not None:
+                voice_engine.set_voice_profile(agent.key, **agent.voice)
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_llm() -> ChatOpenAI:
+    return ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+
+
+def parse_scenario(data: dict, source: str = "<memory>") -> ScenarioSpec:
+    """Validate raw scenario data."""
+    try:
+        return ScenarioSpec.model_validate(data)
+    except ValidationError as e:
+        raise ValueError(f"Invalid scenario {source}:\n{e}") from e
+
+
+def compile_scenario(spec: ScenarioSpec, source: str = "<memory>", digest: str = "") -> CompiledScenario:
+    """Render prompts and resolve voices for a validated scenario."""
+    agents = tuple(
+        CompiledAgent(
+            key=agent.key,
+            name=agent.name,
+            role=agent.role,
+            expertise=tuple(agent.expertise),
+            personality=agent.personality,
+            system_prompt=render_system_prompt(
+                agent.name, agent.role, agent.expertise, agent.personality, spec.company
+            ),
+            voice=agent.voice.model_dump() if agent.voice else None,
+        )
+        for agent in spec.team
+    )
+    items = []
+    for item in spec.agenda.items:
+        if item.kind == "discussion":
+            items.append(
+                Discussion(item.topic, item.primary_speaker or spec.chair, item.num_responses)
+            )
+        elif item.kind == "debate":
+            items.append(Debate(item.topic, item.side1, item.side2, item.max_turns))
+        else:
+            items.append(RoundTable(item.topic))
+    return CompiledScenario(
+        source=source,
+        digest=digest,
+        company=spec.company,
+        chair=spec.chair,
+        agents=agents,
+        agenda=Agenda(spec.agenda.title, tuple(items)),
+    )
+
+
+_compiled: dict[str, CompiledScenario] = {}
+# Lookups by result: "memory", "disk" or "miss"
+cache_stats: Counter = Counter()
+
+
+def load_scenario(
+    path: str, cache_dir: Optional[Path] = DEFAULT_CACHE_DIR
+) -> CompiledScenario:
+    """Load a TOML or JSON scenario, using the compiled cache when possible.
+
+    Args:
+        path: Scenario file (``.toml`` or ``.json``)
+        cache_dir: Directory for compiled scenarios (defaults to a
+            per-user cache directory), or None to skip the disk cache
+
+    Returns:
+        The compiled scenario
+    """
+    raw = Path(path).read_bytes()
+    digest = hashlib.sha256(raw + f"v{COMPILER_VERSION}".encode()).hexdigest()
+    if digest in _compiled:
+        cache_stats["memory"] += 1
+        return _compiled[digest]
+
+    cache_file = Path(cache_dir) / f"{digest}.json" if cache_dir is not None else None
+    if cache_file is not None and cache_file.exists():
+        try:
+            with open(cache_file) as f:
+                compiled = CompiledScenario.from_dict(json.load(f))
+            if compiled.digest != digest:
+                raise ValueError("cache entry does not match its file name")
+            _compiled[digest] = compiled
+            cache_stats["disk"] += 1
+            return compiled
+        except Exception:
+            # Corrupt or incompatible cache entry; rebuild it below
+            pass
+
+    cache_stats["miss"] += 1
+    if str(path).endswith(".toml"):
+        data = tomllib.loads(raw.decode("utf-8"))
+    else:
+        data = json.loads(raw)
+    compiled = compile_scenario(parse_scenario(data, str(path)), str(path), digest)
+
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump(compiled.to_dict(), f)
+        tmp.replace(cache_file)
+    _compiled[digest] = compiled
+    return compiled
@@ -0,0 +1,198 @@
+"""Priority scheduling of LLM calls from meetings sharing one API quota."""
+
+import heapq
+import itertools
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Optional
+
+from routing import percentile
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+# Highest priority first
+PRIORITY_CLASSES = (INTERACTIVE, BATCH)
+
+
+@dataclass
+class ClassStats:
+    """Queueing delay and SLO attainment of one priority class."""
+
+    calls: int = 0
+    slo_met: int = 0
+    waits: deque = field(default_factory=lambda: deque(maxlen=1000))
+    latencies: deque = field(default_factory=lambda: deque(maxlen=1000))
+
+    @property
+    def slo_attainment(self) -> float:
+        return self.slo_met / self.calls if self.calls else 1.0
+
+
+class LLMScheduler:
+    """Admits LLM calls to a fixed number of slots by priority class and meeting.
+
+    Queued interactive calls are always admitted before queued batch calls,
+    and ``interactive_reserve`` slots are never given to batch work, so a
+    live turn finds a free slot even while batch meetings saturate the rest.
+    Within a class, meetings share slots by start-time fair queueing: each
+    call is tagged with its meeting's virtual start time, advanced by
+    ``cost / weight``, and the smallest tag is admitted first. A meeting
+    that issues many calls cannot crowd out one that issues few.
+
+    A meeting's tag is forgotten once the class's virtual time has passed
+    it (or the class goes idle), since it would then start from the
+    virtual time anyway, so finished meetings do not accumulate state in
+    long-running workers. Weights set
+    with ``set_weight`` are kept until ``release`` is called.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        interactive_reserve: int = 1,
+        slo_targets: Optional[dict[str, float]] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: LLM calls allowed in flight at once
+            interactive_reserve: Slots batch calls may never occupy
+            slo_targets: Seconds from request to completion per class
+                (defaults to 10s interactive, 300s batch)
+        """
+        if not 0 <= interactive_reserve < max_concurrency:
+            raise ValueError("interactive_reserve must be below max_concurrency")
+        self.max_concurrency = max_concurrency
+        self.interactive_reserve = interactive_reserve
+        self.slo_targets = {INTERACTIVE: 10.0, BATCH: 300.0}
+        self.slo_targets.update(slo_targets or {})
+        self.stats = {priority: ClassStats() for priority in PRIORITY_CLASSES}
+        self._weights: dict[str, float] = {}
+        self._queues: dict[str, list] = {priority: [] for priority in PRIORITY_CLASSES}
+        self._virtual_time = dict.fromkeys(PRIORITY_CLASSES, 0.0)
+        self._last_tag: dict[tuple[str, str], float] = defaultdict(float)
+        self._prune_at = 64
+        self._running = dict.fromkeys(PRIORITY_CLASSES, 0)
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def set_weight(self, meeting_id: str, weight: float):
+        """Give a meeting a larger (or smaller) share of its class's slots."""
+        if weight <= 0:
+            raise ValueError("weight must be positive")
+        with self._lock:
+            self._weights[meeting_id] = weight
+
+    def release(self, meeting_id: str):
+        """Forget a finished meeting's weight and fair-queueing tags."""
+        with self._lock:
+            self._weights.pop(meeting_id, None)
+            for priority in PRIORITY_CLASSES:
+                self._last_tag.pop((priority, meeting_id), None)
+
+    @contextmanager
+    def slot(self, meeting_id: str, priority: str = INTERACTIVE, cost: float = 1.0):
+        """Block until the call may run, then hold a slot while it does."""
+        if priority not in self._queues:
+            raise ValueError(f"Unknown priority class: {priority}")
+        requested = time.perf_counter()
+        admitted = threading.Event()
+        with self._lock:
+            key = (priority, meeting_id)
+            start = max(self._virtual_time[priority], self._last_tag[key])
+            self._last_tag[key] = start + cost / self._weights.get(meeting_id, 1.0)
+            entry = (start, next(self._seq), admitted)
+            heapq.heappush(self._queues[priority], entry)
+            self._dispatch()
+        try:
+            admitted.wait()
+        except BaseException:
+            # Interrupted while queued: never leave a slot to a caller that is gone
+            with self._lock:
+                if admitted.is_set():
+                    self._running[priority] -= 1
+                    self._dispatch()
+                else:
+                    queue = self._queues[priority]
+                    queue.remove(entry)
+                    heapq.heapify(queue)
+            raise
+        waited = time.perf_counter() - requested
+        try:
+            yield
+        finally:
+            latency = time.perf_counter() - requested
+            with self._lock:
+                self._running[priority] -= 1
+                stats = self.stats[priority]
+                stats.calls += 1
+                stats.slo_met += latency <= self.slo_targets.get(priority, float("inf"))
+                stats.waits.append(waited)
+                stats.latencies.append(latency)
+                if not self._running[priority] and not self._queues[priority]:
+                    self._reset(priority)
+                elif len(self._last_tag) > self._prune_at:
+                    self._prune()
+                self._dispatch()
+
+    def _reset(self, priority: str):
+        # Caller holds the lock. The class is idle: as in start-time fair
+        # queueing, virtual time jumps past every tag, which can then go
+        keys = [key for key in self._last_tag if key[0] == priority]
+        if keys:
+            self._virtual_time[priority] = max(
+                self._virtual_time[priority], *(self._last_tag[key] for key in keys)
+            )
+        for key in keys:
+            del self._last_tag[key]
+
+    def _prune(self):
+        # Caller holds the lock. A tag at or behind virtual time has no effect
+        for key, tag in list(self._last_tag.items()):
+            if tag <= self._virtual_time[key[0]]:
+                del self._last_tag[key]
+        self._prune_at = max(64, 2 * len(self._last_tag))
+
+    def _dispatch(self):
+        # Caller holds the lock
+        while sum(self._running.values()) < self.max_concurrency:
+            if self._queues[INTERACTIVE]:
+                priority = INTERACTIVE
+            elif (
+                self._queues[BATCH]
+                and self._running[BATCH] < self.max_concurrency - self.interactive_reserve
+            ):
+                priority = BATCH
+            else:
+                return
+            start, _, admitted = heapq.heappop(self._queues[priority])
+            self._virtual_time[priority] = start
+            self._running[priority] += 1
+            admitted.set()
+
+    def queued(self, priority: str) -> int:
+        """Calls of a class waiting for a slot."""
+        with self._lock:
+            return len(self._queues[priority])
+
+    def report(self) -> str:
+        """Format per-class queueing delay, latency and SLO attainment."""
+        lines = [
+            f"{'class':<12} {'calls':>6} {'wait p50':>9} {'wait p95':>9} "
+            f"{'p95 s':>7} {'SLO s':>7} {'SLO met':>8}"
+        ]
+        with self._lock:
+            rows = [
+                (priority, stats.calls, list(stats.waits), list(stats.latencies), stats.slo_attainment)
+                for priority, stats in self.stats.items()
+            ]
+        for priority, calls, waits, latencies, attainment in rows:
+            lines.append(
+                f"{priority:<12} {calls:>6} {percentile(waits, 0.5) or 0.0:>9.2f} "
+                f"{percentile(waits, 0.95) or 0.0:>9.2f} {percentile(latencies, 0.95) or 0.0:>7.2f} "
+                f"{self.slo_targets[priority]:>7.1f} {attainment:>8.1%}"
+            )
+        return "\n".join(lines)
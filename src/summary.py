@@ -0,0 +1,92 @@
+"""Incrementally maintained meeting summary with a fixed size cap."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+from langchain_openai import ChatOpenAI
+from langchain_core.messages import HumanMessage, SystemMessage
+
+SUMMARY_SYSTEM_PROMPT = """You maintain the running minutes of a corporate strategy meeting.
+Merge the new discussion into the existing summary. Keep decisions, positions, disagreements and next steps; drop pleasantries and repetition.
+Write plain prose or short bullet points."""
+
+
+class MeetingSummarizer:
+    """Keeps a bounded summary of a meeting, updated after each phase.
+
+    Updates run on a single background worker so they stay off the
+    meeting's critical path and are applied in phase order. Each update only
+    sends the previous summary and the latest phase's statements, so its
+    cost does not grow with meeting length.
+    """
+
+    def __init__(
+        self, llm: Optional[ChatOpenAI] = None, max_chars: int = 1500
+    ):
+        """Initialize the summarizer.
+
+        Args:
+            llm: Chat model used for updates (defaults to gpt-4o-mini)
+            max_chars: Hard cap on the summary length
+        """
+        self.llm = llm or ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+        self.max_chars = max_chars
+        self.summary = ""
+        self.updates = 0
+        self.errors = 0
+        self.tracer = None
+        # Set by TeamMeeting from its own verbosity
+        self.verbose = True
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary")
+        self._pending: Optional[Future] = None
+
+    def update(self, phase: str, entries: list[str]) -> Future:
+        """Queue the statements of a finished phase for merging."""
+        self._pending = self._executor.submit(self._apply, phase, list(entries))
+        return self._pending
+
+    def _apply(self, phase: str, entries: list[str]):
+        if not entries:
+            return
+        prompt = f"""Current summary:
+{self.summary or "(meeting just started)"}
+
+New discussion ({phase}):
+{chr(10).join(entries)}
+
+Return the updated summary in at most {self.max_chars} characters."""
+        messages = [SystemMessage(content=SUMMARY_SYSTEM_PROMPT), HumanMessage(content=prompt)]
+        try:
+            if self.tracer is not None and self.tracer.enabled:
+                with self.tracer.span("summary update", "summary", phase=phase):
+                    response = self.llm.invoke(messages)
+            else:
+                response = self.llm.invoke(messages)
+        except Exception as e:
+            self.errors += 1
+            if self.verbose:
+                print(f"Warning: Could not update meeting summary: {e}")
+            return
+        self.summary = truncate(str(response.content).strip(), self.max_chars)
+        self.updates += 1
+
+    def current(self, timeout: Optional[float] = None) -> str:
+        """Return the summary once all queued updates have been applied."""
+        if self._pending is not None:
+            self._pending.result(timeout=timeout)
+        return self.summary
+
+    def close(self):
+        """Stop the background worker after pending updates finish."""
+        self._executor.shutdown(wait=True)
+
+
+def truncate(text: str, max_chars: int) -> str:
+    """Cut text to at most max_chars, preferring a sentence or line boundary."""
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundary = max(cut.rfind(". "), cut.rfind("\n"))
+    if boundary > max_chars // 2:
+        return cut[: boundary + 1].rstrip()
+    return cut.rstrip()
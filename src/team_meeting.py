@@ -1,37 +1,165 @@
 """Team meeting orchestration and discussion management."""
 
+import itertools
+from typing import Optional
+
 from colorama import Fore, Style, init
 from agents import CEO, CFO, CTO, COO, VPMarketing
+from agenda import DEFAULT_AGENDA, Agenda, AgendaItem
+from convergence import DebateOutcome
+from relevance import RelevanceIndex
+from tracing import traced
+from transcript import Transcript
 from tts import create_voice_engine
 
 init(autoreset=True)
 
+OPENING_PROMPT = "Open the meeting '{title}' by setting the agenda. The items to discuss are: {topics}"
+CLOSING_PROMPT = "Provide closing remarks summarizing the key decisions and next steps from this strategy meeting"
+RECAP_PROMPT = "Briefly recap the key points and open questions from the meeting so far"
+DEBATE_OUTCOME_PROMPT = "State the outcome of the debate on '{topic}': where the sides agree, what remains open, and the decision or next step"
+
+_meeting_ids = itertools.count(1)
+
+
+def opening_prompt(agenda: Agenda) -> str:
+    """The chair's opening instruction for an agenda."""
+    topics = "; ".join(item.topic for item in agenda.items)
+    return OPENING_PROMPT.format(title=agenda.title, topics=topics)
+
+
+def create_default_team(llm=None) -> dict:
+    """Create the default TechVenture executive team keyed by agent id.
+
+    Args:
+        llm: Chat model shared by every agent (defaults to one per agent)
+    """
+    return {
+        "ceo": CEO(llm=llm),
+        "cfo": CFO(llm=llm),
+        "cto": CTO(llm=llm),
+        "coo": COO(llm=llm),
+        "marketing": VPMarketing(llm=llm),
+    }
+
 
 class TeamMeeting:
     """Orchestrates discussions between multiple corporate agents."""
 
-    def __init__(self, enable_audio: bool = False):
+    def __init__(
+        self,
+        enable_audio: bool = False,
+        routing_policy=None,
+        hedge_policy=None,
+        summarizer=None,
+        verbose: bool = True,
+        tracer=None,
+        stream_audio: bool = False,
+        agents: Optional[dict] = None,
+        chair: str = "ceo",
+        convergence=None,
+        panel_responder=None,
+        scheduler=None,
+        meeting_id: Optional[str] = None,
+        priority: str = "interactive",
+        metrics=None,
+        relevance_threshold: float = 0.0,
+    ):
         """Initialize the team with all agents.
 
         Args:
             enable_audio: Whether to enable text-to-speech output
+            routing_policy: Optional RoutingPolicy choosing a model per turn
+            hedge_policy: Optional HedgePolicy duplicating slow LLM calls
+            summarizer: Optional MeetingSummarizer updated after each phase
+                and used as context for recaps and closing remarks
+            verbose: Whether to print the meeting to the console
+            tracer: Optional Tracer recording spans for phases, LLM calls and TTS
+            stream_audio: With audio enabled, stream each response and start
+                speaking it sentence by sentence while it is still generating
+            agents: Team keyed by agent id (defaults to the TechVenture executives)
+            chair: Key of the agent who opens, recaps and closes the meeting
+            convergence: Optional ConvergenceDetector that ends debates early
+                once positions stop moving and adds a synthesized outcome
+            panel_responder: Optional PanelResponder generating all of a
+                topic's responses in one structured call
+            scheduler: Optional LLMScheduler shared by meetings on one quota
+            meeting_id: Identifies this meeting to the scheduler for fair
+                queueing (defaults to a per-process counter)
+            priority: Scheduler priority class, "interactive" or "batch"
+            metrics: Optional MeetingMetrics recording LLM calls, TTS and
+                meetings in flight, shared by every meeting in a worker
+            relevance_threshold: Minimum relevance score for a colleague to
+                respond in a discussion; 0 always fills ``num_responses``
         """
-        self.agents = {
-            "ceo": CEO(),
-            "cfo": CFO(),
-            "cto": CTO(),
-            "coo": COO(),
-            "marketing": VPMarketing(),
-        }
-        self.meeting_transcript = []
+        self.agents = agents if agents is not None else create_default_team()
+        if chair not in self.agents:
+            raise ValueError(f"Chair '{chair}' is not a member of the team")
+        self.chair = chair
+        self.meeting_id = meeting_id or f"meeting-{next(_meeting_ids)}"
+        for key, agent in self.agents.items():
+            agent.key = key
+            agent.scheduler = scheduler
+            agent.meeting_id = self.meeting_id
+            agent.priority = priority
+            agent.metrics = metrics
+            agent.router = routing_policy
+            agent.hedger = hedge_policy
+            agent.tracer = tracer
+        self.routing_policy = routing_policy
+        self.hedge_policy = hedge_policy
+        self.summarizer = summarizer
+        self.convergence = convergence
+        self.panel_responder = panel_responder
+        if panel_responder:
+            panel_responder.verbose = verbose
+        self.scheduler = scheduler
+        self.relevance = RelevanceIndex(self.agents)
+        self.relevance_threshold = relevance_threshold
+        self.skipped_responses = 0
+        self.debate_outcomes: list[DebateOutcome] = []
+        self.meeting_transcript = Transcript()
+        self._phase_start = 0
+        self._phase_clears = 0
         self.voice_engine = create_voice_engine(enable_audio=enable_audio)
         self.enable_audio = enable_audio
+        self.verbose = verbose
+        self.stream_audio = stream_audio
+        self._voice_stream = None
+        self.tracer = tracer
+        self.voice_engine.tracer = tracer
+        if summarizer:
+            summarizer.tracer = tracer
+            summarizer.verbose = verbose
+        self.metrics = metrics
+        self.voice_engine.metrics = metrics
+        if metrics:
+            metrics.watch_voice_engine(self.voice_engine)
+            if hedge_policy:
+                metrics.watch_hedging(hedge_policy)
+            if panel_responder:
+                panel_responder.metrics = metrics
+
+    @classmethod
+    def from_scenario(cls, scenario, **kwargs) -> "TeamMeeting":
+        """Create a meeting for a CompiledScenario's team and voice profiles.
+
+        Run it with ``meeting.run_agenda(scenario.agenda)``.
+        """
+        meeting = cls(agents=scenario.build_team(), chair=scenario.chair, **kwargs)
+        scenario.apply_voices(meeting.voice_engine)
+        return meeting
+
+    def say(self, text: str = ""):
+        """Print meeting output unless running quietly."""
+        if self.verbose:
+            print(text)
 
     def print_header(self, text: str, color: str = Fore.CYAN):
         """Print a formatted header."""
-        print(f"\n{color}{'=' * 80}")
-        print(f"{color}{text.center(80)}")
-        print(f"{color}{'=' * 80}{Style.RESET_ALL}\n")
+        self.say(f"\n{color}{'=' * 80}")
+        self.say(f"{color}{text.center(80)}")
+        self.say(f"{color}{'=' * 80}{Style.RESET_ALL}\n")
 
     def print_speaker(self, agent_name: str, role: str, content: str):
         """Print a speaker's statement with formatting."""
@@ -44,31 +172,64 @@ class TeamMeeting:
         }
         color = color_map.get(agent_name, Fore.WHITE)
 
-        print(f"{color}[{role}]{Style.RESET_ALL}")
-        print(f"{content}\n")
+        self.say(f"{color}[{role}]{Style.RESET_ALL}")
+        self.say(f"{content}\n")
 
         # Generate audio if enabled
-        if self.enable_audio and self.voice_engine:
+        if self._voice_stream is not None:
+            # Already speaking from the token stream; queue the final sentence
+            self._voice_stream.close()
+            self._voice_stream = None
+        elif self.enable_audio and self.voice_engine:
             try:
                 self.voice_engine.speak(content, agent_name)
             except Exception as e:
                 print(f"{Fore.RED}[TTS Error]: {e}{Style.RESET_ALL}")
 
-        self.meeting_transcript.append(f"[{role}]\n{content}\n")
+        agent = self.agents.get(agent_name)
+        call = agent.last_call if agent else None
+        if call:
+            self.meeting_transcript.append(
+                agent_name,
+                role,
+                content,
+                call.phase,
+                call.latency,
+                call.input_tokens + call.output_tokens,
+            )
+        else:
+            self.meeting_transcript.append(agent_name, role, content)
+
+    def voice_feed(self, agent_name: str):
+        """Token callback that streams the next turn to the voice engine, if enabled."""
+        if not (self.stream_audio and self.enable_audio and self.voice_engine):
+            return None
+        self._voice_stream = self.voice_engine.open_stream(agent_name)
+        return self._voice_stream.feed if self._voice_stream else None
 
-    def open_meeting(self):
-        """Start the team meeting with CEO opening remarks."""
-        self.print_header("TECHVENTURE CORP - QUARTERLY STRATEGY MEETING")
-        print(f"{Fore.WHITE}Meeting Date: Q1 Strategic Review")
-        print("Location: Executive Boardroom")
-        print("Agenda: AI Innovation Strategy & Market Expansion\n")
+    @traced()
+    def open_meeting(self, title: Optional[str] = None, agenda: Agenda = DEFAULT_AGENDA):
+        """Start the team meeting with opening remarks from the chair (the CEO by default).
 
-        ceo = self.agents["ceo"]
-        opening = ceo.think(
-            "Open a quarterly strategy meeting by setting the agenda for discussing AI innovation and market expansion"
+        Args:
+            title: Meeting title (defaults to the agenda's title)
+            agenda: Agenda the header lists and the chair introduces
+        """
+        self.print_header(title or agenda.title)
+        self.say(f"{Fore.WHITE}Location: Executive Boardroom")
+        self.say("Agenda:")
+        for number, item in enumerate(agenda.items, 1):
+            self.say(f"  {number}. {item.topic}")
+        self.say()
+
+        chair = self.agents[self.chair]
+        opening = chair.think(
+            opening_prompt(agenda), phase="opening", on_token=self.voice_feed(self.chair)
         )
-        self.print_speaker("ceo", ceo.role, opening)
+        self.print_speaker(self.chair, chair.role, opening)
+        self.end_phase("opening")
 
+    @traced()
     def discuss_topic(
         self, topic: str, primary_speaker: str = "ceo", num_responses: int = 3
     ):
@@ -77,102 +238,239 @@ class TeamMeeting:
 
         # Primary speaker opens the topic
         agent = self.agents[primary_speaker]
-        opening_statement = agent.think(topic)
+        opening_statement = agent.think(
+            topic, phase="topic_opening", on_token=self.voice_feed(primary_speaker)
+        )
         self.print_speaker(primary_speaker, agent.role, opening_statement)
 
-        # Get responses from other agents
-        other_agents = [a for a in self.agents.keys() if a != primary_speaker]
-        respondents = other_agents[:num_responses]
-
-        for respondent_key in respondents:
-            respondent = self.agents[respondent_key]
-            response = respondent.respond_to_colleague(
-                agent.name, opening_statement, topic
+        # Get responses from the colleagues most relevant to the topic
+        respondents = self.relevance.rank(
+            topic, num_responses, exclude=[primary_speaker], threshold=self.relevance_threshold
+        )
+        self.skipped_responses += min(num_responses, len(self.agents) - 1) - len(respondents)
+
+        if self.panel_responder is not None and len(respondents) > 1:
+            # One structured call for every respondent's reply
+            replies = self.panel_responder.respond(
+                {key: self.agents[key] for key in respondents},
+                agent.name,
+                opening_statement,
+                topic,
             )
-            self.print_speaker(respondent_key, respondent.role, response)
+            if self.stream_audio and self.enable_audio:
+                # The streamed topic opening may still be queued for speech
+                self.voice_engine.wait_until_done()
+            for respondent_key, response in replies.items():
+                self.print_speaker(respondent_key, self.agents[respondent_key].role, response)
+        else:
+            for respondent_key in respondents:
+                respondent = self.agents[respondent_key]
+                response = respondent.respond_to_colleague(
+                    agent.name,
+                    opening_statement,
+                    topic,
+                    on_token=self.voice_feed(respondent_key),
+                )
+                self.print_speaker(respondent_key, respondent.role, response)
+        self.end_phase(f"discussion: {topic}")
+
+    @traced()
+    def facilitate_debate(
+        self, debate_topic: str, side1: str, side2: str, max_turns: int = 3
+    ):
+        """Facilitate a structured debate between two executives.
 
-    def facilitate_debate(self, debate_topic: str, side1: str, side2: str):
-        """Facilitate a structured debate between two executives."""
+        The sides alternate for up to ``max_turns`` statements. With a
+        convergence detector the debate stops as soon as positions converge
+        or start repeating, and the chair then synthesizes the outcome.
+        """
         self.print_header(f"DEBATE: {debate_topic}")
 
-        agent1 = self.agents[side1]
-        agent2 = self.agents[side2]
-
-        # Side 1 opens
-        print(f"{Fore.WHITE}[Position 1 - {agent1.role}]{Style.RESET_ALL}")
-        statement1 = agent1.think(f"Argue for: {debate_topic}")
-        self.print_speaker(side1, agent1.role, statement1)
-
-        # Side 2 responds
-        print(f"{Fore.WHITE}[Position 2 - {agent2.role}]{Style.RESET_ALL}")
-        statement2 = agent2.respond_to_colleague(agent1.name, statement1, debate_topic)
-        self.print_speaker(side2, agent2.role, statement2)
-
-        # Side 1 counter-responds
-        print(f"{Fore.WHITE}[Rebuttal - {agent1.role}]{Style.RESET_ALL}")
-        rebuttal = agent1.respond_to_colleague(agent2.name, statement2, debate_topic)
-        self.print_speaker(side1, agent1.role, rebuttal)
+        speakers = [(side1, self.agents[side1]), (side2, self.agents[side2])]
+        statements = []
+        latency = 0.0
+        stop_reason = "max_turns"
+
+        for turn in range(max_turns):
+            key, agent = speakers[turn % 2]
+            if turn == 0:
+                label = "Position 1"
+            elif turn == 1:
+                label = "Position 2"
+            elif turn == 2:
+                label = "Rebuttal"
+            else:
+                label = f"Round {turn // 2 + 1}"
+            self.say(f"{Fore.WHITE}[{label} - {agent.role}]{Style.RESET_ALL}")
+
+            if turn == 0:
+                statement = agent.think(
+                    f"Argue for: {debate_topic}", phase="debate", on_token=self.voice_feed(key)
+                )
+            else:
+                statement = agent.respond_to_colleague(
+                    speakers[(turn + 1) % 2][1].name,
+                    statements[-1],
+                    debate_topic,
+                    phase="debate",
+                    on_token=self.voice_feed(key),
+                )
+            self.print_speaker(key, agent.role, statement)
+            statements.append(statement)
+            if agent.last_call:
+                latency += agent.last_call.latency
+
+            if self.convergence and turn + 1 < max_turns:
+                reason = self.convergence.check(statements)
+                if reason:
+                    stop_reason = reason
+                    break
+
+        outcome = DebateOutcome(
+            topic=debate_topic,
+            max_turns=max_turns,
+            turns=len(statements),
+            stop_reason=stop_reason,
+            mean_turn_latency=latency / len(statements) if statements else 0.0,
+        )
+        if self.convergence and statements:
+            outcome.synthesis = self.synthesize_debate(debate_topic, speakers, statements)
+            chair_call = self.agents[self.chair].last_call
+            if chair_call:
+                outcome.synthesis_latency = chair_call.latency
+        self.debate_outcomes.append(outcome)
+        self.end_phase(f"debate: {debate_topic}")
+
+    def synthesize_debate(self, debate_topic: str, speakers: list, statements: list[str]) -> str:
+        """Have the chair state the outcome of a finished debate."""
+        self.say(f"{Fore.WHITE}[Debate Outcome]{Style.RESET_ALL}")
+        transcript = "\n".join(
+            f"{speakers[i % 2][1].name}: {statement}" for i, statement in enumerate(statements)
+        )
+        chair = self.agents[self.chair]
+        synthesis = chair.think(
+            DEBATE_OUTCOME_PROMPT.format(topic=debate_topic),
+            f"Debate so far:\n{transcript}",
+            phase="debate_outcome",
+            on_token=self.voice_feed(self.chair),
+        )
+        self.print_speaker(self.chair, chair.role, synthesis)
+        return synthesis
 
+    @traced()
     def round_table_discussion(self, topic: str):
         """Conduct a round-table discussion where each agent contributes."""
         self.print_header(f"ROUND TABLE: {topic}")
 
         # Each agent contributes
         for key, agent in self.agents.items():
-            thought = agent.think(topic)
+            thought = agent.think(
+                topic, phase="round_table", on_token=self.voice_feed(key)
+            )
             self.print_speaker(key, agent.role, thought)
+        self.end_phase(f"round table: {topic}")
 
+    @traced()
     def closing_remarks(self):
-        """CEO provides closing remarks."""
+        """The chair (the CEO by default) provides closing remarks."""
         self.print_header("CLOSING REMARKS")
 
-        ceo = self.agents["ceo"]
-        closing = ceo.think(
-            "Provide closing remarks summarizing the key decisions and next steps from this strategy meeting"
+        chair = self.agents[self.chair]
+        closing = chair.think(
+            CLOSING_PROMPT,
+            self.summary_context(),
+            phase="closing",
+            on_token=self.voice_feed(self.chair),
         )
-        self.print_speaker("ceo", ceo.role, closing)
-
+        self.print_speaker(self.chair, chair.role, closing)
+
+    @traced()
+    def recap(self):
+        """The chair recaps the meeting so far from the running summary."""
+        self.print_header("RECAP")
+
+        chair = self.agents[self.chair]
+        recap = chair.think(
+            RECAP_PROMPT,
+            self.summary_context(),
+            phase="recap",
+            on_token=self.voice_feed(self.chair),
+        )
+        self.print_speaker(self.chair, chair.role, recap)
+        self.end_phase("recap")
+
+    def end_phase(self, phase: str):
+        """Mark the end of a phase and queue its statements for the summary."""
+        if self.meeting_transcript.clears != self._phase_clears:
+            # The transcript was cleared during the phase
+            self._phase_start = 0
+            self._phase_clears = self.meeting_transcript.clears
+        if self.summarizer:
+            self.summarizer.update(phase, self.meeting_transcript[self._phase_start :])
+        self._phase_start = len(self.meeting_transcript)
+
+    def summary_context(self) -> str:
+        """Running meeting summary as prompt context (empty without a summarizer)."""
+        if not self.summarizer:
+            return ""
+        summary = self.summarizer.current()
+        return f"Meeting summary so far:\n{summary}" if summary else ""
+
+    @traced(category="io")
     def save_transcript(self, filename: str = "meeting_transcript.txt"):
         """Save the meeting transcript to a file."""
         with open(filename, "w") as f:
-            f.write("\n".join(self.meeting_transcript))
-        print(f"\n{Fore.GREEN}Meeting transcript saved to {filename}{Style.RESET_ALL}")
+            self.meeting_transcript.write(f)
+        self.say(f"\n{Fore.GREEN}Meeting transcript saved to {filename}{Style.RESET_ALL}")
+
+    def run_item(self, item: AgendaItem):
+        """Run a single agenda item."""
+        if item.kind == "discussion":
+            self.discuss_topic(
+                item.topic,
+                primary_speaker=item.primary_speaker,
+                num_responses=item.num_responses,
+            )
+        elif item.kind == "debate":
+            self.facilitate_debate(
+                item.topic,
+                side1=item.side1,
+                side2=item.side2,
+                max_turns=item.max_turns,
+            )
+        elif item.kind == "round_table":
+            self.round_table_discussion(item.topic)
+
+    @traced(category="meeting")
+    def run_agenda(self, agenda: Agenda):
+        """Run opening remarks, every agenda item in order, and closing remarks."""
+        if self.metrics:
+            self.metrics.meeting_started()
+        try:
+            self._run_agenda(agenda)
+        except Exception:
+            if self.metrics:
+                self.metrics.meeting_finished("failed")
+            raise
+        finally:
+            if self.scheduler:
+                self.scheduler.release(self.meeting_id)
+            if self.summarizer:
+                self.summarizer.close()
+        if self.metrics:
+            self.metrics.meeting_finished()
+
+    def _run_agenda(self, agenda: Agenda):
+        self.open_meeting(agenda=agenda)
+        for item in agenda.items:
+            self.run_item(item)
+        self.closing_remarks()
+        if self.stream_audio:
+            self.voice_engine.wait_until_done()
 
     def run_full_meeting(self):
         """Run a complete corporate strategy meeting."""
-        self.open_meeting()
-
-        # AI Innovation Strategy
-        self.discuss_topic(
-            "Should we invest heavily in in-house AI/ML capabilities or partner with external AI providers?",
-            primary_speaker="cto",
-        )
-
-        # Budget vs Innovation debate
-        self.facilitate_debate(
-            "Budget Allocation: R&D Investment vs Shareholder Returns",
-            side1="cto",
-            side2="cfo",
-        )
-
-        # Market Expansion
-        self.round_table_discussion(
-            "How should we position TechVenture in emerging markets while managing operational complexity?"
-        )
-
-        # Team Integration Topic
-        self.discuss_topic(
-            "What are the key talent challenges in scaling our AI team?",
-            primary_speaker="coo",
-        )
-
-        # Final Strategy
-        self.discuss_topic(
-            "What should be our primary competitive advantage in the next 18 months?",
-            primary_speaker="marketing",
-        )
-
-        self.closing_remarks()
+        self.run_agenda(DEFAULT_AGENDA)
         self.save_transcript()
 
 
@@ -0,0 +1,213 @@
+"""Lightweight tracing spans exported to Chrome trace or OTLP-style JSON."""
+
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Optional
+
+
+class Span:
+    """A timed, named region of work, possibly nested in another span."""
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "category",
+        "attributes",
+        "span_id",
+        "parent_id",
+        "thread_id",
+        "start_ns",
+        "end_ns",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, attributes: dict):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+        self.span_id = next(tracer._ids)
+        self.parent_id = None
+        self.thread_id = threading.get_ident()
+        self.start_ns = 0
+        self.end_ns = 0
+
+    def set(self, key: str, value):
+        """Attach an attribute to the span."""
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        stack = self.tracer._stack()
+        if stack:
+            self.parent_id = stack[-1].span_id
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self.tracer._stack().pop()
+        self.tracer._finish(self)
+        return False
+
+
+class _NoopSpan:
+    """Shared do-nothing span returned while tracing is disabled."""
+
+    __slots__ = ()
+
+    def set(self, key: str, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Collects spans in memory for export after a run.
+
+    While disabled, ``span()`` returns a shared no-op object, so instrumented
+    code pays only a method call and an attribute check.
+    """
+
+    def __init__(self, enabled: bool = True, service_name: str = "agentic-team-chat"):
+        """Initialize the tracer.
+
+        Args:
+            enabled: Whether spans are recorded
+            service_name: Service name written to OTLP exports
+        """
+        self.enabled = enabled
+        self.service_name = service_name
+        self.trace_id = uuid.uuid4().hex
+        self.spans: list[Span] = []
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._epoch_perf_ns = time.perf_counter_ns()
+        self._epoch_unix_ns = time.time_ns()
+
+    def span(self, name: str, category: str = "", **attributes):
+        """Open a span; use as a context manager."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, category, attributes)
+
+    def _stack(self) -> list:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _finish(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def _unix_ns(self, perf_ns: int) -> int:
+        return self._epoch_unix_ns + perf_ns - self._epoch_perf_ns
+
+    def export_chrome(self, path: str):
+        """Write spans as Chrome trace event JSON (chrome://tracing, Perfetto)."""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events = [
+            {
+                "name": span.name,
+                "cat": span.category or "span",
+                "ph": "X",
+                "ts": (span.start_ns - self._epoch_perf_ns) / 1000,
+                "dur": (span.end_ns - span.start_ns) / 1000,
+                "pid": pid,
+                "tid": span.thread_id,
+                "args": _jsonable(span.attributes),
+            }
+            for span in spans
+        ]
+        for thread_id, name in _thread_names(spans).items():
+            events.append(
+                {"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": name}}
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def export_otlp(self, path: str):
+        """Append spans to a file as one OTLP/JSON ExportTraceServiceRequest line."""
+        with self._lock:
+            spans = list(self.spans)
+        otlp_spans = []
+        for span in spans:
+            record = {
+                "traceId": self.trace_id,
+                "spanId": f"{span.span_id:016x}",
+                "name": span.name,
+                "kind": 1,
+                "startTimeUnixNano": str(self._unix_ns(span.start_ns)),
+                "endTimeUnixNano": str(self._unix_ns(span.end_ns)),
+                "attributes": [
+                    {"key": key, "value": {"stringValue": str(value)}}
+                    for key, value in span.attributes.items()
+                ],
+            }
+            if span.parent_id is not None:
+                record["parentSpanId"] = f"{span.parent_id:016x}"
+            otlp_spans.append(record)
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            {"key": "service.name", "value": {"stringValue": self.service_name}}
+                        ]
+                    },
+                    "scopeSpans": [{"scope": {"name": __name__}, "spans": otlp_spans}],
+                }
+            ]
+        }
+        with open(path, "a") as f:
+            f.write(json.dumps(payload) + "\n")
+
+
+def traced(name: Optional[str] = None, category: str = "phase"):
+    """Wrap a method in a span when its object's ``tracer`` is enabled."""
+
+    def decorate(method):
+        span_name = name or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            tracer = self.tracer
+            if tracer is None or not tracer.enabled:
+                return method(self, *args, **kwargs)
+            attributes = {f"arg{i}": str(arg)[:120] for i, arg in enumerate(args)}
+            attributes.update({key: str(value)[:120] for key, value in kwargs.items()})
+            with tracer.span(span_name, category, **attributes):
+                return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorate
+
+
+def _jsonable(attributes: dict) -> dict:
+    return {
+        key: value if isinstance(value, (str, int, float, bool)) or value is None else str(value)
+        for key, value in attributes.items()
+    }
+
+
+def _thread_names(spans: list[Span]) -> dict[int, str]:
+    names = {thread.ident: thread.name for thread in threading.enumerate()}
+    return {span.thread_id: names.get(span.thread_id, str(span.thread_id)) for span in spans}
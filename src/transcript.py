@@ -0,0 +1,144 @@
+"""Compact, column-oriented meeting transcript."""
+
+from array import array
+from typing import Iterator, Optional, TextIO
+
+
+class Utterance:
+    """One statement in a meeting, materialized on demand from a Transcript."""
+
+    __slots__ = ("agent", "role", "phase", "content", "latency", "tokens")
+
+    def __init__(
+        self,
+        agent: str,
+        role: str,
+        phase: str,
+        content: str,
+        latency: float = 0.0,
+        tokens: int = 0,
+    ):
+        self.agent = agent
+        self.role = role
+        self.phase = phase
+        self.content = content
+        self.latency = latency
+        self.tokens = tokens
+
+    def format(self) -> str:
+        """Render the utterance in transcript text form."""
+        return f"[{self.role}]\n{self.content}\n"
+
+    def __repr__(self) -> str:
+        return f"Utterance(agent={self.agent!r}, phase={self.phase!r}, content={self.content[:40]!r})"
+
+
+class Transcript:
+    """Append-only meeting transcript stored as columns.
+
+    Speakers and phases are interned to small integer ids, statement text is
+    kept UTF-8 encoded in a single byte buffer, and per-turn latency and token
+    counts live in typed arrays. Text formatting only happens on access or
+    export. Indexing and iteration yield formatted entries, so a Transcript
+    can be used wherever the old list of strings was.
+    """
+
+    def __init__(self):
+        self._speakers: list[tuple[str, str]] = []
+        self._speaker_ids: dict[tuple[str, str], int] = {}
+        self._phases: list[str] = []
+        self._phase_ids: dict[str, int] = {}
+
+        self._speaker_col = array("H")
+        self._phase_col = array("H")
+        self._offsets = array("Q", [0])
+        self._text = bytearray()
+        self.latency = array("f")
+        self.tokens = array("I")
+        # Times the transcript was cleared, so readers holding an index can tell
+        self.clears = 0
+
+    @staticmethod
+    def _intern(value, ids: dict, values: list) -> int:
+        index = ids.get(value)
+        if index is None:
+            index = len(values)
+            ids[value] = index
+            values.append(value)
+        return index
+
+    def append(
+        self,
+        agent: str,
+        role: str,
+        content: str,
+        phase: str = "",
+        latency: float = 0.0,
+        tokens: int = 0,
+    ):
+        """Add a statement to the transcript."""
+        self._speaker_col.append(
+            self._intern((agent, role), self._speaker_ids, self._speakers)
+        )
+        self._phase_col.append(self._intern(phase, self._phase_ids, self._phases))
+        self._text += content.encode("utf-8")
+        self._offsets.append(len(self._text))
+        self.latency.append(latency)
+        self.tokens.append(tokens)
+
+    def __len__(self) -> int:
+        return len(self._speaker_col)
+
+    def record(self, index: int) -> Utterance:
+        """Materialize the utterance at an index."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("transcript index out of range")
+        agent, role = self._speakers[self._speaker_col[index]]
+        content = self._text[self._offsets[index] : self._offsets[index + 1]].decode(
+            "utf-8"
+        )
+        return Utterance(
+            agent,
+            role,
+            self._phases[self._phase_col[index]],
+            content,
+            self.latency[index],
+            self.tokens[index],
+        )
+
+    def records(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Utterance]:
+        """Iterate over utterances in a range."""
+        for index in range(*slice(start, stop).indices(len(self))):
+            yield self.record(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.record(i).format() for i in range(*index.indices(len(self)))]
+        return self.record(index).format()
+
+    def __iter__(self) -> Iterator[str]:
+        for utterance in self.records():
+            yield utterance.format()
+
+    def clear(self):
+        """Remove all statements, keeping interned speakers and phases."""
+        del self._speaker_col[:]
+        del self._phase_col[:]
+        del self._offsets[1:]
+        self._text.clear()
+        del self.latency[:]
+        del self.tokens[:]
+        self.clears += 1
+
+    def write(self, f: TextIO):
+        """Stream the formatted transcript to a text file."""
+        for index, entry in enumerate(self):
+            if index:
+                f.write("\n")
+            f.write(entry)
+
+    def to_text(self) -> str:
+        """Format the whole transcript as text."""
+        return "\n".join(self)
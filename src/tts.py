@@ -1,7 +1,81 @@
 """Text-to-Speech functionality for agents using pyttsx3."""
 
+import queue
+import re
+import threading
+import time
 import pyttsx3
 from pathlib import Path
+from typing import Optional
+
+# Sentence end: terminal punctuation, optional closing quotes/brackets, then whitespace
+_SENTENCE_END = re.compile(r"[.!?]+[\"')\]]*(?=\s)")
+_ABBREVIATIONS = {"mr.", "mrs.", "ms.", "dr.", "vs.", "etc.", "inc.", "corp.", "e.g.", "i.e.", "approx."}
+
+
+class SentenceChunker:
+    """Cuts a stream of text fragments into complete sentences."""
+
+    def __init__(self, min_chars: int = 20):
+        """Initialize the chunker.
+
+        Args:
+            min_chars: Shorter sentences are merged with the next one so that
+                very short fragments are not synthesized on their own
+        """
+        self.min_chars = min_chars
+        self._buffer = ""
+
+    def feed(self, text: str) -> list[str]:
+        """Add a fragment and return any sentences it completed."""
+        self._buffer += text
+        sentences = []
+        start = 0
+        for match in _SENTENCE_END.finditer(self._buffer):
+            candidate = self._buffer[start : match.end()].strip()
+            last_word = candidate.rsplit(None, 1)[-1].lower()
+            if len(candidate) < self.min_chars or last_word in _ABBREVIATIONS:
+                continue
+            sentences.append(candidate)
+            start = match.end()
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> list[str]:
+        """Return whatever text remains at the end of the stream."""
+        rest, self._buffer = self._buffer.strip(), ""
+        return [rest] if rest else []
+
+
+class SpeechStream:
+    """Feeds an agent's token stream to the voice engine sentence by sentence.
+
+    The voice profile is resolved once when the stream opens, so every
+    sentence of a turn is spoken with the same voice.
+    """
+
+    def __init__(self, voice: "AgentVoice", agent_name: str):
+        self.voice = voice
+        self.agent_name = agent_name
+        self.voice_props = voice.get_voice_properties(agent_name)
+        self.chunker = SentenceChunker()
+        self.opened_at = time.perf_counter()
+        self.first_audio_latency: Optional[float] = None
+        self.sentences = 0
+
+    def feed(self, text: str):
+        """Add generated text; complete sentences are queued for synthesis."""
+        for sentence in self.chunker.feed(text):
+            self._enqueue(sentence)
+
+    def close(self):
+        """Queue the remaining text. Audio keeps playing in the background."""
+        for sentence in self.chunker.flush():
+            self._enqueue(sentence)
+
+    def _enqueue(self, sentence: str):
+        self.sentences += 1
+        self.voice._queue.put((sentence, self))
 
 
 class AgentVoice:
@@ -17,6 +91,13 @@ class AgentVoice:
         self.engine = None
         self.audio_dir = Path("audio_output")
         self.available_voices = []
+        self.tracer = None
+        self.metrics = None
+        self.voice_profiles: dict[str, dict] = {}
+        self.first_audio_latencies: list[float] = []
+        self._queue: queue.Queue = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._engine_lock = threading.Lock()
 
         if self.enable_audio:
             try:
@@ -44,6 +125,21 @@ class AgentVoice:
             Assigns different system voices to each agent for distinct voices.
             Falls back to rate/volume adjustments if not enough voices available.
         """
+        profile = self.voice_profiles.get(agent_name)
+        if profile is not None:
+            voice_id = (
+                self.available_voices[
+                    profile["voice_index"] % len(self.available_voices)
+                ].id
+                if self.available_voices
+                else None
+            )
+            return {
+                "voice_id": voice_id,
+                "rate": profile["rate"],
+                "volume": profile["volume"],
+            }
+
         # Assign different voice indices to each agent
         agent_indices = {
             "Sarah Chen": 0,  # CEO - first voice
@@ -81,6 +177,23 @@ class AgentVoice:
             "volume": 1.0,
         }
 
+    def set_voice_profile(
+        self, agent_name: str, voice_index: int = 0, rate: int = 175, volume: float = 1.0
+    ):
+        """Assign a voice profile to an agent, overriding the built-in ones.
+
+        Args:
+            agent_name: Name or key the agent is spoken as
+            voice_index: Index into the system voices (wraps around)
+            rate: Speech rate in words per minute
+            volume: Volume between 0.0 and 1.0
+        """
+        self.voice_profiles[agent_name] = {
+            "voice_index": voice_index,
+            "rate": rate,
+            "volume": volume,
+        }
+
     def speak(self, text: str, agent_name: str, save_audio: bool = False) -> str:
         """Convert text to speech using pyttsx3.
 
@@ -95,14 +208,29 @@ class AgentVoice:
         if not self.enable_audio or not self.engine:
             return ""
 
+        if self.tracer is not None and self.tracer.enabled:
+            with self.tracer.span("tts speak", "tts", agent=agent_name, chars=len(text)):
+                return self._speak(text, agent_name, save_audio)
+        return self._speak(text, agent_name, save_audio)
+
+    def _apply_voice(self, voice_props: dict):
+        if voice_props["voice_id"]:
+            self.engine.setProperty("voice", voice_props["voice_id"])
+        self.engine.setProperty("rate", voice_props["rate"])
+        self.engine.setProperty("volume", voice_props["volume"])
+
+    def _speak(self, text: str, agent_name: str, save_audio: bool) -> str:
+        with self._engine_lock:
+            start = time.perf_counter()
+            result = self._speak_locked(text, agent_name, save_audio)
+            if self.metrics is not None:
+                self.metrics.record_tts(agent_name, time.perf_counter() - start)
+            return result
+
+    def _speak_locked(self, text: str, agent_name: str, save_audio: bool) -> str:
         try:
             voice_props = self.get_voice_properties(agent_name)
-
-            # Set voice properties
-            if voice_props["voice_id"]:
-                self.engine.setProperty("voice", voice_props["voice_id"])
-            self.engine.setProperty("rate", voice_props["rate"])
-            self.engine.setProperty("volume", voice_props["volume"])
+            self._apply_voice(voice_props)
 
             if save_audio:
                 # Save to file
@@ -120,6 +248,62 @@ class AgentVoice:
             print(f"Error in TTS for {agent_name}: {e}")
             return ""
 
+    def open_stream(self, agent_name: str) -> Optional[SpeechStream]:
+        """Start speaking an agent's turn while it is still being generated.
+
+        Args:
+            agent_name: Name of the agent speaking
+
+        Returns:
+            A SpeechStream to feed tokens into, or None if audio is disabled
+        """
+        if not self.enable_audio or not self.engine:
+            return None
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=self._synthesize_queue, name="tts-worker", daemon=True
+            )
+            self._worker.start()
+        return SpeechStream(self, agent_name)
+
+    def _synthesize_queue(self):
+        while True:
+            sentence, stream = self._queue.get()
+            try:
+                if stream.first_audio_latency is None:
+                    stream.first_audio_latency = time.perf_counter() - stream.opened_at
+                    self.first_audio_latencies.append(stream.first_audio_latency)
+                start = time.perf_counter()
+                if self.tracer is not None and self.tracer.enabled:
+                    with self.tracer.span(
+                        "tts sentence", "tts", agent=stream.agent_name, chars=len(sentence)
+                    ):
+                        self._say_sentence(sentence, stream.voice_props)
+                else:
+                    self._say_sentence(sentence, stream.voice_props)
+                if self.metrics is not None:
+                    self.metrics.record_tts(stream.agent_name, time.perf_counter() - start)
+            except Exception as e:
+                print(f"Error in streaming TTS for {stream.agent_name}: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _say_sentence(self, sentence: str, voice_props: dict):
+        with self._engine_lock:
+            self._apply_voice(voice_props)
+            self.engine.say(sentence)
+            self.engine.runAndWait()
+
+    @property
+    def queue_depth(self) -> int:
+        """Sentences waiting to be synthesized."""
+        return self._queue.qsize()
+
+    def wait_until_done(self):
+        """Block until every queued sentence has been spoken."""
+        if self._worker is not None:
+            self._queue.join()
+
     def speak_all(self, speaker_name: str, text: str, save_audio: bool = False):
         """Speak text with agent's voice and handle display.
 
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Test script to verify request hedging without requiring OpenAI API key.
+"""
+
+import asyncio
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from hedging import HedgePolicy
+
+MODEL = "fake-model"
+
+
+class FakeLLM:
+    """Chat model stand-in whose async calls follow a script.
+
+    Each script entry is an async function run for one ``ainvoke`` call.
+    """
+
+    def __init__(self, *script):
+        self.script = list(script)
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        return "sync"
+
+    async def ainvoke(self, messages):
+        step = self.script[self.calls]
+        self.calls += 1
+        return await step()
+
+
+def make_policy(measure_losers: bool = False) -> HedgePolicy:
+    """A policy that hedges every call after 50ms."""
+    policy = HedgePolicy(
+        min_samples=1, max_hedge_ratio=1.0, min_delay=0.05, measure_losers=measure_losers
+    )
+    policy.latency.record(MODEL, 0.05)
+    return policy
+
+
+def reply(text: str, delay: float = 0.0):
+    async def step():
+        await asyncio.sleep(delay)
+        return text
+
+    return step
+
+
+def fail(message: str, delay: float = 0.0):
+    async def step():
+        await asyncio.sleep(delay)
+        raise RuntimeError(message)
+
+    return step
+
+
+def test_hedging():
+    """Test the hedge race and the statistics it records."""
+    print("\n" + "=" * 60)
+    print("Request Hedging Test")
+    print("=" * 60 + "\n")
+
+    # Test 1: Warm-up calls are not hedged
+    print("Test 1: Calls before min_samples are sent once...")
+    try:
+        policy = HedgePolicy(min_samples=5)
+        llm = FakeLLM()
+        assert policy.invoke(llm, [], MODEL) == "sync"
+        assert policy.stats.hedges == 0 and policy.stats.calls == 1
+        print("✓ Warm-up call went through without a hedge")
+    except Exception as e:
+        print(f"✗ Warm-up call failed: {e!r}")
+        return False
+
+    # Test 2: A fast primary wins without a hedge
+    print("\nTest 2: Fast primary...")
+    try:
+        policy = make_policy()
+        llm = FakeLLM(reply("primary"))
+        assert policy.invoke(llm, [], MODEL) == "primary"
+        assert llm.calls == 1 and policy.stats.hedges == 0
+        print("✓ Primary answered before the hedge delay")
+    except Exception as e:
+        print(f"✗ Fast primary failed: {e!r}")
+        return False
+
+    # Test 3: A slow primary loses to the hedge and is still measured
+    print("\nTest 3: Slow primary loses to the hedge (measuring losers)...")
+    try:
+        policy = make_policy(measure_losers=True)
+        llm = FakeLLM(reply("primary", 0.5), reply("hedge"))
+        start = time.perf_counter()
+        assert policy.invoke(llm, [], MODEL) == "hedge"
+        assert time.perf_counter() - start < 0.4
+        assert policy.stats.hedge_wins == 1
+        time.sleep(0.6)
+        assert len(policy.stats.primary) == 1 and policy.stats.primary[0] >= 0.5
+        # The delay estimate got the primary's latency, not the hedged one
+        assert policy.latency.percentile(MODEL, 1.0) >= 0.5
+        assert policy.stats.tail_improvement() > 0.3
+        assert "p99_improvement=" in policy.report()
+        print(f"✓ Hedge won; {policy.report()}")
+    except Exception as e:
+        print(f"✗ Hedge race failed: {e!r}")
+        return False
+
+    # Test 4: Primary fails in the same round the hedge succeeds
+    print("\nTest 4: Primary fails as the hedge succeeds...")
+    try:
+        policy = make_policy()
+        released = asyncio.Event()
+
+        async def primary():
+            await released.wait()
+            raise RuntimeError("primary failed")
+
+        async def hedge():
+            released.set()
+            return "hedge"
+
+        llm = FakeLLM(primary, hedge)
+        assert policy.invoke(llm, [], MODEL) == "hedge"
+        print("✓ Successful hedge returned despite the failed primary")
+    except Exception as e:
+        print(f"✗ Failed primary was not masked by the hedge: {e!r}")
+        return False
+
+    # Test 5: The call fails only when every request fails
+    print("\nTest 5: Primary and hedge both fail...")
+    try:
+        policy = make_policy()
+        llm = FakeLLM(fail("primary failed", 0.1), fail("hedge failed"))
+        try:
+            policy.invoke(llm, [], MODEL)
+        except RuntimeError as e:
+            assert str(e) == "primary failed"
+        else:
+            raise AssertionError("expected an error")
+        print("✓ Primary's error raised after both requests failed")
+    except Exception as e:
+        print(f"✗ Double failure handled wrongly: {e!r}")
+        return False
+
+    # Test 6: By default the loser is cancelled and no improvement is reported
+    print("\nTest 6: Cancelled losers...")
+    try:
+        policy = make_policy()
+        cancelled = []
+
+        async def slow_primary():
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "primary"
+
+        llm = FakeLLM(slow_primary, reply("hedge", 0.02))
+        assert policy.invoke(llm, [], MODEL) == "hedge"
+        time.sleep(0.05)
+        assert cancelled and policy.stats.primary == []
+        assert "p99_improvement" not in policy.report()
+        # The cancelled primary counts at least as slow as the hedge delay
+        assert policy.latency.percentile(MODEL, 1.0) >= 0.05
+        print(f"✓ {policy.report()}")
+    except Exception as e:
+        print(f"✗ Cancelled losers handled wrongly: {e!r}")
+        return False
+
+    # Test 7: The hedge holds a slot of its own
+    print("\nTest 7: Hedge slot...")
+    try:
+        policy = make_policy()
+        events = []
+
+        @contextmanager
+        def slot():
+            events.append("enter")
+            yield
+            events.append("exit")
+
+        llm = FakeLLM(reply("primary", 0.3), reply("hedge"))
+        assert policy.invoke(llm, [], MODEL, hedge_slot=slot) == "hedge"
+        time.sleep(0.05)
+        assert events == ["enter", "exit"]
+
+        # A primary that finishes while the hedge waits for its slot is not hedged
+        policy = make_policy()
+        llm = FakeLLM(reply("primary", 0.1), reply("hedge"))
+
+        @contextmanager
+        def busy_slot():
+            time.sleep(0.2)
+            yield
+
+        assert policy.invoke(llm, [], MODEL, hedge_slot=busy_slot) == "primary"
+        assert llm.calls == 1 and policy.stats.hedges == 0
+        print("✓ Hedge ran inside its own slot")
+    except Exception as e:
+        print(f"✗ Hedge slot handled wrongly: {e!r}")
+        return False
+
+    print("\n" + "=" * 60)
+    print("✓ All hedging tests passed!")
+    print("=" * 60 + "\n")
+    return True
+
+
+if __name__ == "__main__":
+    success = test_hedging()
+    sys.exit(0 if success else 1)